@@ -1,28 +0,0 @@
-"""
-LaView NVR Video Downloader
-
-A tool for downloading video recordings from LaView NVR devices.
-"""
-
-from . import camerasdk
-from . import cli
-from . import config
-from . import work
-from . import utils
-from . import logging
-from . import time_interval
-from . import track
-from . import authtype
-
-__version__ = "1.0.0"
-__all__ = [
-    "camerasdk",
-    "cli", 
-    "config",
-    "work",
-    "utils",
-    "logging",
-    "time_interval",
-    "track",
-    "authtype"
-]
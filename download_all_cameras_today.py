@@ -8,13 +8,25 @@ range on the current day.
 
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
 from typing import Any, Dict, List, Optional
 
 from laview_dl.authtype import AuthType
 from laview_dl.camerasdk import CameraSdk, init
 from laview_dl.config import ConfigManager
+from laview_dl.logging import Logger
 from laview_dl.work import work
 
+# Upper bound on cameras downloaded concurrently; NVRs limit parallel streams.
+MAX_PARALLEL_DOWNLOADS = 4
+
+_SEP = "=" * 60
+
+# Serializes per-camera reports written from worker threads
+_print_lock = threading.Lock()
+
 
 def get_all_cameras(
     auth_handler: Any, camera_ip: str, max_channels: int = 10,
@@ -43,14 +55,14 @@ def get_all_cameras(
     -----
     First attempts to get camera info from the NVR API. If that fails,
     falls back to detecting cameras by testing video search on different
-    channels.
+    channels, probing them concurrently.
     """
     # Try to get camera info from NVR API first
     camera_list = CameraSdk.get_camera_info(auth_handler, camera_ip)
     if camera_list:
         return camera_list
 
-    # Fallback to detection method
+    # Fallback to detection method, probing channels concurrently
     camera_list = CameraSdk.detect_available_cameras(
         auth_handler, camera_ip, max_channels,
     )
@@ -61,10 +73,66 @@ def get_all_cameras(
     return []
 
 
+def _download_one(
+    camera: Dict[str, Any],
+    camera_ip: str,
+    start_datetime_str: str,
+    end_datetime_str: str,
+    auth_handler: Any,
+) -> None:
+    """
+    Download video from a single camera channel.
+
+    Parameters
+    ----------
+    camera : Dict[str, Any]
+        Camera information dictionary as returned by get_all_cameras.
+    camera_ip : str
+        IP address of the NVR device.
+    start_datetime_str : str
+        Start of the time range.
+    end_datetime_str : str
+        End of the time range.
+    auth_handler : Any
+        Authentication handler shared by all cameras of the NVR.
+
+    Notes
+    -----
+    The camera's status block is written to stdout in a single write once
+    the download finishes, so reports from concurrent workers don't
+    interleave.
+    """
+    camera_id = camera["id"]
+    header = f"Processing Camera {camera_id}: {camera['name']}"
+    try:
+        # Logger is initialized once by the caller; authentication is reused
+        # and UTC time is used, so work() makes no extra round-trips.
+        work(
+            camera_ip,
+            start_datetime_str,
+            end_datetime_str,
+            True,
+            camera_id,
+            auth_handler=auth_handler,
+            local_time_offset=timedelta(),
+        )
+        result_line = f"✓ Successfully downloaded video from Camera {camera_id}"
+    except Exception as e:
+        result_line = f"✗ Error downloading from Camera {camera_id}: {e}"
+        # Only formatted when the logger is at DEBUG level (--debug)
+        Logger.get_logger().debug(f"Camera {camera_id} failed", exc_info=True)
+
+    report = "\n".join(("", _SEP, header, _SEP, result_line, ""))
+    with _print_lock:
+        sys.stdout.write(report)
+        sys.stdout.flush()
+
+
 def download_from_all_cameras(
     device_name: Optional[str] = None,
     start_time: str = "3:30 PM",
     end_time: str = "5:00 PM",
+    debug: bool = False,
 ) -> None:
     """
     Download video from all cameras for a specified time range today.
@@ -80,6 +148,9 @@ def download_from_all_cameras(
     end_time : str, optional
         End time in natural language format (e.g., "5:00 PM"), by default
         "5:00 PM".
+    debug : bool, optional
+        Log at DEBUG level, including tracebacks of per-camera failures,
+        by default False.
 
     Raises
     ------
@@ -159,9 +230,9 @@ def download_from_all_cameras(
     for camera in cameras:
         print(f"  - Camera {camera['id']}: {camera['name']}")
 
-    # Build datetime strings (using natural language parsing from date_parser)
-    start_datetime_str = f"{start_time}"
-    end_datetime_str = f"{end_time}"
+    # Datetime strings are passed through as-is and parsed by date_parser
+    start_datetime_str = start_time
+    end_datetime_str = end_time
 
     print(f"\nDownloading video from {start_datetime_str} to {end_datetime_str}")
 
@@ -169,34 +240,38 @@ def download_from_all_cameras(
     # (log file is based on IP, not camera ID, so we only need to init once)
     # Use the first camera's ID for directory creation
     first_camera_id = cameras[0]["id"] if cameras else 1
-    init(camera_ip, first_camera_id, verbose_level=0)
+    # verbose_level 6 and above selects logging.DEBUG
+    init(camera_ip, first_camera_id, verbose_level=6 if debug else 0)
 
-    # Download from each camera
+    # Download from the enabled cameras concurrently; each download is
+    # dominated by network I/O against the NVR.
+    enabled_cameras = []
     for camera in cameras:
-        camera_id = camera["id"]
-        camera_name = camera["name"]
-
         if not camera.get("enabled", True):
-            print(f"\nSkipping disabled camera: {camera_name} (ID: {camera_id})")
+            print(f"\nSkipping disabled camera: {camera['name']} (ID: {camera['id']})")
             continue
-
-        print(f"\n{'=' * 60}")
-        print(f"Processing Camera {camera_id}: {camera_name}")
-        print(f"{'=' * 60}")
-
-        try:
-            # Download video (logger already initialized above)
-            work(camera_ip, start_datetime_str, end_datetime_str, True, camera_id)
-
-            print(f"✓ Successfully downloaded video from Camera {camera_id}")
-
-        except Exception as e:
-            print(f"✗ Error downloading from Camera {camera_id}: {e}")
-            continue
-
-    print(f"\n{'=' * 60}")
+        enabled_cameras.append(camera)
+
+    if enabled_cameras:
+        max_workers = min(len(enabled_cameras), MAX_PARALLEL_DOWNLOADS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _download_one,
+                    camera,
+                    camera_ip,
+                    start_datetime_str,
+                    end_datetime_str,
+                    auth_handler,
+                )
+                for camera in enabled_cameras
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    print(f"\n{_SEP}")
     print("Download process completed")
-    print(f"{'=' * 60}")
+    print(_SEP)
 
 
 def main() -> None:
@@ -227,6 +302,11 @@ def main() -> None:
         default="yesterday 5:00 PM",
         help='End time in natural language format (default: "5:00 PM")',
     )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Log at DEBUG level, including tracebacks of per-camera failures",
+    )
 
     args = parser.parse_args()
 
@@ -235,6 +315,7 @@ def main() -> None:
             device_name=args.device,
             start_time=args.start_time,
             end_time=args.end_time,
+            debug=args.debug,
         )
     except RuntimeError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -249,5 +330,3 @@ def main() -> None:
 
 if __name__ == "__main__":
     main()
-
-s
@@ -2,20 +2,12 @@
 LaView NVR Video Downloader
 
 A tool for downloading video recordings from LaView NVR devices.
+
+Submodules are loaded lazily on first attribute access (PEP 562) so that
+``import laview_dl`` does not pull in ``requests`` or ``dateparser``.
 """
 
-from . import (
-    authtype,
-    camerasdk,
-    cli,
-    config,
-    date_parser,
-    logging,
-    time_interval,
-    track,
-    utils,
-    work,
-)
+import importlib
 
 __version__ = "1.0.0"
 __all__ = [
@@ -25,8 +17,23 @@ __all__ = [
     "config",
     "date_parser",
     "logging",
+    "probe_cache",
     "time_interval",
     "track",
     "utils",
     "work",
 ]
+
+_LAZY = frozenset(__all__)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module("." + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
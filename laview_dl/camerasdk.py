@@ -1,23 +1,36 @@
-import re
+import errno
+import itertools
+import select
 import shutil
 import socket
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import timedelta
+from functools import lru_cache, partial
+from http import HTTPStatus
 from xml.etree import ElementTree
-from xml.etree.ElementTree import Element, SubElement
+from xml.sax.saxutils import escape
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth, HTTPDigestAuth
 
 from .authtype import AuthType
 from .logging import Logger, LogPrinter, logging_wrapper
+from .probe_cache import ProbeCache
+from .time_interval import TimeInterval
 from .track import Track
 from .utils import (
     DEFAULT_TIMEOUT_SECONDS,
+    MAX_PARALLEL_NVR_STREAMS,
+    MAX_PARALLEL_TRACK_SEARCHES,
     MAX_VIDEOS_NUMBER_IN_ONE_REQUEST,
+    MIN_PARALLEL_SEARCH_INTERVAL,
     create_directory_for,
     get_path_to_video_archive,
+    nvr_stream_slot,
 )
 
 MAX_BYTES_LOG_FILE_SIZE = 100000
@@ -25,11 +38,107 @@ MAX_LOG_FILES_COUNT = 20
 
 write_logs = True
 
+# Request bodies are fixed apart from a few text fields, so they are
+# rendered from byte templates rather than built as ElementTree trees.
+_SEARCH_TEMPLATE = (
+    b"<CMSearchDescription>"
+    b"<searchID>%b</searchID>"
+    b"<trackIDList><trackID>%b</trackID></trackIDList>"
+    b"<timeSpanList><timeSpan>"
+    b"<startTime>%b</startTime><endTime>%b</endTime>"
+    b"</timeSpan></timeSpanList>"
+    b"<maxResults>%b</maxResults>"
+    b"<searchResultPostion>0</searchResultPostion>"
+    b"<metadataList>"
+    b"<metadataDescriptor>//recordType.meta.std-cgi.com</metadataDescriptor>"
+    b"</metadataList>"
+    b"</CMSearchDescription>"
+)
+_PROBE_TEMPLATE = (
+    b"<CMSearchDescription>"
+    b"<searchID>%b</searchID>"
+    b"<trackIDList><trackID>%b</trackID></trackIDList>"
+    b"<timeSpanList><timeSpan>"
+    b"<startTime>%b</startTime><endTime>%b</endTime>"
+    b"</timeSpan></timeSpanList>"
+    b"</CMSearchDescription>"
+)
+_DOWNLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+_DOWNLOAD_TEMPLATE = b"<downloadRequest><playbackURI>%b</playbackURI></downloadRequest>"
+
+
+# Child tags that may carry each channel field, most preferred first
+_CHANNEL_FIELD_TAGS = {
+    "id": ("id", "channelID", "inputID"),
+    "name": ("name", "channelName", "inputName"),
+    "enabled": ("enabled", "status"),
+}
+_CHANNEL_FIELD_BY_TAG = {
+    tag: (field, rank)
+    for field, tags in _CHANNEL_FIELD_TAGS.items()
+    for rank, tag in enumerate(tags)
+}
+
+# Search IDs only correlate requests, so a per-process random prefix plus a
+# counter is enough to keep them unique
+_SEARCH_ID_PREFIX = uuid.uuid4().hex[:8]
+_search_id_counter = itertools.count()
+
+
+def _next_search_id():
+    return f"{_SEARCH_ID_PREFIX}{next(_search_id_counter):016x}".encode()
+
+
+def _xml_text(value):
+    return escape(str(value)).encode("utf-8")
+
+
+def _parse_hms(text):
+    """Read a leading "H:M:S" from text; return (hours, minutes, seconds) or None."""
+    fields = text.split(":", 2)
+    if len(fields) < 3:
+        return None
+    hours, minutes, rest = fields
+    end = 0
+    while end < len(rest) and rest[end].isdigit():
+        end += 1
+    if not (hours.isdigit() and minutes.isdigit() and end):
+        return None
+    return int(hours), int(minutes), int(rest[:end])
+
+
+def _wait_writable(sock, timeout):
+    # poll() has no FD_SETSIZE limit; select() remains for platforms without it
+    if hasattr(select, "poll"):
+        poller = select.poll()
+        poller.register(sock, select.POLLOUT)
+        return bool(poller.poll(int(timeout * 1000)))
+    _, writable, _ = select.select([], [sock], [], timeout)
+    return bool(writable)
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets disable Nagle and enable TCP keepalive."""
+
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
 
 class CameraSdk:
     default_timeout_seconds = 10
     DEVICE_ERROR_CODE = 500
     __CAMERA_AVAILABILITY_TEST_PORT = 80
+    __REBOOT_POLL_MIN_SECONDS = 0.01
+    __REBOOT_POLL_MAX_SECONDS = 0.5
+    # A connect pending this long is restarted; while the NVR reboots its SYNs
+    # may be dropped, and the kernel's retransmit backoff grows to ~30 s
+    __REBOOT_CONNECT_MAX_SECONDS = 1.0
     # =============================== URLS ===============================
 
     __TIME_URL = "/ISAPI/System/time"
@@ -43,106 +152,181 @@ class CameraSdk:
 
     # =============================== URLS ===============================
 
+    # Pools are kept for up to HTTP_POOL_CONNECTIONS NVRs, each holding up to
+    # HTTP_POOL_MAXSIZE connections to that one host
+    HTTP_POOL_CONNECTIONS = 4
+    HTTP_POOL_MAXSIZE = 16
+
+    # Shared by all requests so connections (and Digest nonces) are reused
+    _session = None
+
+    # Auth type and timezone, keyed by (cam_ip, user_name, password), do not
+    # change while the program runs; both are dropped for a camera when it
+    # reboots or rejects our credentials.
+    _auth_type_cache = {}
+    _time_offset_cache = {}
+    # Guards both caches; worker threads fill and invalidate them concurrently
+    _cache_lock = threading.Lock()
+    # Persists the same results across runs; see ProbeCache
+    _probe_cache = None
+    __AUTH_TYPE_NAMES = {"BASIC": AuthType.BASIC, "DIGEST": AuthType.DIGEST}
+
     @classmethod
     def init(cls, default_timeout_seconds):
         cls.default_timeout_seconds = default_timeout_seconds
+        cls.get_session()
+
+    @classmethod
+    def get_session(cls):
+        if cls._session is None:
+            session = requests.Session()
+            adapter = _KeepAliveAdapter(
+                pool_connections=cls.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=cls.HTTP_POOL_MAXSIZE,
+            )
+            session.mount("http://", adapter)
+            # Search results are verbose XML; ask for them compressed
+            session.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+            cls._session = session
+        return cls._session
 
     @classmethod
     def get_error_message_from(cls, answer):
-        answer_text = cls.__clear_xml_from_namespaces(answer.text)
-        answer_xml = ElementTree.fromstring(answer_text)
+        answer_xml = ElementTree.fromstring(answer.content)
 
-        answer_status_element = answer_xml.find("statusString")
-        answer_substatus_element = answer_xml.find("subStatusCode")
+        answer_status_element = answer_xml.find("{*}statusString")
+        answer_substatus_element = answer_xml.find("{*}subStatusCode")
 
         if answer_status_element is not None and answer_substatus_element is not None:
             status = answer_status_element.text
             substatus = answer_substatus_element.text
             message = f"Error {answer.status_code} {answer.reason}: {status} - {substatus}"
         else:
-            message = answer_text
+            message = answer.content.decode("utf-8", errors="replace")
 
         return message
 
     @classmethod
     def reboot_camera(cls, auth_handler, cam_ip):
-        answer = requests.put(
+        answer = cls.get_session().put(
             cls.__get_service_url(cam_ip, cls.__REBOOT_URL),
             auth=auth_handler,
             data=[],
             timeout=cls.default_timeout_seconds,
         )
+        cls.invalidate_cache(cam_ip)
         if not answer:
             raise RuntimeError(cls.get_error_message_from(answer))
 
     @classmethod
-    def get_auth_type(cls, cam_ip, user_name, password):
-        auth_handler = HTTPBasicAuth(user_name, password)
-        request = cls.__make_get_request(auth_handler, cam_ip, cls.__TIME_URL)
-        if request.ok:
-            return AuthType.BASIC
+    def get_probe_cache(cls):
+        if cls._probe_cache is None:
+            cls._probe_cache = ProbeCache()
+        return cls._probe_cache
 
-        auth_handler = HTTPDigestAuth(user_name, password)
-        request = cls.__make_get_request(auth_handler, cam_ip, cls.__TIME_URL)
-        if request.ok:
-            return AuthType.DIGEST
+    @classmethod
+    def invalidate_cache(cls, cam_ip):
+        with cls._cache_lock:
+            for cache in (cls._auth_type_cache, cls._time_offset_cache):
+                for key in [key for key in cache if key[0] == cam_ip]:
+                    del cache[key]
+        cls.get_probe_cache().discard(cam_ip)
+
+    @classmethod
+    def get_auth_type(cls, cam_ip, user_name, password, use_cache=True):
+        # With use_cache=False the credentials are always checked against the camera
+        key = (cam_ip, user_name, password)
+        auth_type = None
+        if use_cache:
+            with cls._cache_lock:
+                auth_type = cls._auth_type_cache.get(key)
+            if auth_type is None:
+                cached = cls.get_probe_cache().get(cam_ip, user_name, password)
+                auth_type = cls.__AUTH_TYPE_NAMES.get(cached.get("auth"))
+        if auth_type is None:
+            auth_type = cls.__detect_auth_type(cam_ip, user_name, password)
+            if auth_type == AuthType.UNAUTHORISED:
+                return auth_type
+            auth_name = next(name for name, value in cls.__AUTH_TYPE_NAMES.items() if value == auth_type)
+            cls.get_probe_cache().update(cam_ip, user_name, password, auth=auth_name)
+        with cls._cache_lock:
+            cls._auth_type_cache[key] = auth_type
+        return auth_type
+
+    @classmethod
+    def __detect_auth_type(cls, cam_ip, user_name, password):
+        # Probe both schemes at once; whichever is accepted first wins
+        probes = (
+            (AuthType.BASIC, HTTPBasicAuth(user_name, password)),
+            (AuthType.DIGEST, HTTPDigestAuth(user_name, password)),
+        )
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {
+                executor.submit(cls.__make_get_request, auth_handler, cam_ip, cls.__TIME_URL): auth_type
+                for auth_type, auth_handler in probes
+            }
+            for future in as_completed(futures):
+                if future.result().ok:
+                    for other in futures:
+                        other.cancel()
+                    return futures[future]
 
         return AuthType.UNAUTHORISED
 
     @classmethod
-    def get_time_offset(cls, auth_handler, cam_ip):
+    def get_time_offset(cls, auth_handler, cam_ip, use_cache=True):
+        user_name, password = auth_handler.username, auth_handler.password
+        key = (cam_ip, user_name, password)
+        if use_cache:
+            with cls._cache_lock:
+                time_offset = cls._time_offset_cache.get(key)
+            if time_offset is not None:
+                return time_offset
+
+            offset_seconds = cls.get_probe_cache().get(cam_ip, user_name, password).get("tz_offset_seconds")
+            if offset_seconds is not None:
+                time_offset = timedelta(seconds=offset_seconds)
+                with cls._cache_lock:
+                    cls._time_offset_cache[key] = time_offset
+                return time_offset
+
         answer = cls.__make_get_request(auth_handler, cam_ip, cls.__TIME_URL)
         if answer:
-            time_info_text = cls.__clear_xml_from_namespaces(answer.text)
-            time_info_xml = ElementTree.fromstring(time_info_text)
-            timezone_raw = time_info_xml.find("timeZone")
+            time_info_xml = ElementTree.fromstring(answer.content)
+            timezone_raw = time_info_xml.find("{*}timeZone")
             time_offset = cls.parse_timezone(timezone_raw.text)
+            with cls._cache_lock:
+                cls._time_offset_cache[key] = time_offset
+            cls.get_probe_cache().update(
+                cam_ip, user_name, password, tz_offset_seconds=time_offset.total_seconds(),
+            )
             return time_offset
         raise RuntimeError(cls.get_error_message_from(answer))
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def parse_timezone(raw_timezone):
-        try:
-            # Handle complex timezone format like "CST+5:00:00DST01:00:00,M3.2.1/02:00:00,M11.1.1/00:00:00"
-            # Extract the base offset and DST offset
-
-            # Remove timezone name (CST, EST, etc.)
-            timezone_text = raw_timezone
-            for tz_name in ["CST", "EST", "PST", "MST", "GMT", "UTC"]:
-                timezone_text = timezone_text.replace(tz_name, "")
-
-            # Look for the base offset (e.g., +5:00:00)
-            import re
-            base_offset_match = re.search(r"([+-]\d+):(\d+):(\d+)", timezone_text)
-            if not base_offset_match:
-                return timedelta(0)
-
-            hours = int(base_offset_match.group(1))
-            minutes = int(base_offset_match.group(2))
-            seconds = int(base_offset_match.group(3))
-
-            # Look for DST offset (e.g., DST01:00:00)
-            dst_offset_match = re.search(r"DST(\d+):(\d+):(\d+)", timezone_text)
-            if dst_offset_match:
-                dst_hours = int(dst_offset_match.group(1))
-                dst_minutes = int(dst_offset_match.group(2))
-                dst_seconds = int(dst_offset_match.group(3))
-
-                # Add DST offset to base offset
-                total_hours = hours + dst_hours
-                total_minutes = minutes + dst_minutes
-                total_seconds = seconds + dst_seconds
-            else:
-                total_hours = hours
-                total_minutes = minutes
-                total_seconds = seconds
-
-            # Create timedelta (negative because we want UTC offset)
-            return -timedelta(hours=total_hours, minutes=total_minutes, seconds=total_seconds)
-
-        except (ValueError, IndexError, AttributeError):
-            # Handle unexpected timezone formats gracefully
-            return timedelta(0)  # Return zero offset for unknown formats
+        # Handle POSIX-style values like "CST+5:00:00DST01:00:00,M3.2.1/02:00:00,M11.1.1/00:00:00":
+        # a zone name, a signed base offset, then optionally "DST" and its offset
+        if not isinstance(raw_timezone, str):
+            return timedelta(0)
+
+        base_text, _, dst_text = raw_timezone.partition("DST")
+        sign_index = next((i for i, ch in enumerate(base_text) if ch in "+-"), -1)
+        base_offset = _parse_hms(base_text[sign_index + 1:]) if sign_index >= 0 else None
+        if base_offset is None:
+            return timedelta(0)
+
+        offset = timedelta(hours=base_offset[0], minutes=base_offset[1], seconds=base_offset[2])
+        if base_text[sign_index] == "-":
+            offset = -offset
+
+        dst_offset = _parse_hms(dst_text)
+        if dst_offset is not None:
+            offset += timedelta(hours=dst_offset[0], minutes=dst_offset[1], seconds=dst_offset[2])
+
+        # Negated because the value is the local-to-UTC difference
+        return -offset
 
     @classmethod
     def get_device_info(cls, auth_handler, cam_ip):
@@ -150,17 +334,16 @@ class CameraSdk:
         try:
             answer = cls.__make_get_request(auth_handler, cam_ip, cls.__DEVICE_INFO_URL)
             if answer and answer.ok:
-                device_info_text = cls.__clear_xml_from_namespaces(answer.text)
-                device_info_xml = ElementTree.fromstring(device_info_text)
+                device_info_xml = ElementTree.fromstring(answer.content)
 
                 # Extract device information
-                device_name = device_info_xml.find("deviceName")
-                device_id = device_info_xml.find("deviceID")
-                model = device_info_xml.find("model")
-                serial_number = device_info_xml.find("serialNumber")
-                mac_address = device_info_xml.find("macAddress")
-                firmware_version = device_info_xml.find("firmwareVersion")
-                firmware_released_date = device_info_xml.find("firmwareReleasedDate")
+                device_name = device_info_xml.find("{*}deviceName")
+                device_id = device_info_xml.find("{*}deviceID")
+                model = device_info_xml.find("{*}model")
+                serial_number = device_info_xml.find("{*}serialNumber")
+                mac_address = device_info_xml.find("{*}macAddress")
+                firmware_version = device_info_xml.find("{*}firmwareVersion")
+                firmware_released_date = device_info_xml.find("{*}firmwareReleasedDate")
 
                 return {
                     "deviceName": device_name.text if device_name is not None else "Unknown",
@@ -178,120 +361,124 @@ class CameraSdk:
     @classmethod
     def get_camera_info(cls, auth_handler, cam_ip):
         """Get camera information from the NVR."""
-        # Try multiple possible endpoints for camera information
+        # Try multiple possible endpoints for camera information. All are
+        # requested at once; the first endpoint in this order that lists
+        # cameras wins, without waiting on the slower ones.
         endpoints = [
             cls.__CAMERA_INFO_URL,
             cls.__CAMERA_INFO_URL_ALT,
             cls.__CAMERA_INFO_URL_ALT2,
         ]
 
-        for endpoint in endpoints:
-            try:
-                answer = cls.__make_get_request(auth_handler, cam_ip, endpoint)
-                if answer and answer.ok:
-                    camera_info_text = cls.__clear_xml_from_namespaces(answer.text)
-                    camera_info_xml = ElementTree.fromstring(camera_info_text)
-
-                    # Try different XML structures
-                    channels = []
-
-                    # Try videoInputChannel elements
-                    channels = camera_info_xml.findall(".//videoInputChannel")
-                    if not channels:
-                        # Try videoInput elements
-                        channels = camera_info_xml.findall(".//videoInput")
-                    if not channels:
-                        # Try input elements
-                        channels = camera_info_xml.findall(".//input")
-
-                    camera_list = []
-
-                    for channel in channels:
-                        channel_id = channel.find("id")
-                        if channel_id is None:
-                            channel_id = channel.find("channelID")
-                        if channel_id is None:
-                            channel_id = channel.find("inputID")
-
-                        name = channel.find("name")
-                        if name is None:
-                            name = channel.find("channelName")
-                        if name is None:
-                            name = channel.find("inputName")
-
-                        enabled = channel.find("enabled")
-                        if enabled is None:
-                            enabled = channel.find("status")
-
-                        if channel_id is not None:
-                            camera_info = {
-                                "id": int(channel_id.text),
-                                "name": name.text if name is not None else f"Camera {channel_id.text}",
-                                "enabled": enabled.text.lower() == "true" if enabled is not None else True,
-                            }
-                            camera_list.append(camera_info)
-
-                    if camera_list:
-                        return camera_list
-
-            except Exception:
-                continue
+        executor = ThreadPoolExecutor(max_workers=len(endpoints))
+        try:
+            futures = [
+                executor.submit(cls.__get_camera_list, auth_handler, cam_ip, endpoint)
+                for endpoint in endpoints
+            ]
+            for future in futures:
+                camera_list = future.result()
+                if camera_list:
+                    return camera_list
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         return None
 
     @classmethod
-    def detect_available_cameras(cls, auth_handler, cam_ip, max_channels=10):
-        """Detect available cameras by testing video search on different channels."""
-        available_cameras = []
-
-        # Test channels 0-9 (0 is usually the grid view, 1-9 are individual cameras)
-        # Start with channel 0 to check for grid view
-        for channel in range(max_channels):
-            try:
-                # Create a simple search request for this channel
-                search_request = Element("CMSearchDescription")
-
-                # Add searchID
-                search_id = SubElement(search_request, "searchID")
-                search_id.text = str(uuid.uuid4())
-
-                # Add trackIDList
-                track_id_list = SubElement(search_request, "trackIDList")
-                track_id = SubElement(track_id_list, "trackID")
-                track_id.text = f"{channel:02d}01"  # Format as 2-digit number + "01"
+    def __get_camera_list(cls, auth_handler, cam_ip, endpoint):
+        try:
+            answer = cls.__make_get_request(auth_handler, cam_ip, endpoint)
+            if answer and answer.ok:
+                camera_info_xml = ElementTree.fromstring(answer.content)
+
+                # Try different XML structures
+                channels = []
+
+                # Try videoInputChannel elements
+                channels = camera_info_xml.findall(".//{*}videoInputChannel")
+                if not channels:
+                    # Try videoInput elements
+                    channels = camera_info_xml.findall(".//{*}videoInput")
+                if not channels:
+                    # Try input elements
+                    channels = camera_info_xml.findall(".//{*}input")
+
+                camera_list = []
+
+                for channel in channels:
+                    # One pass over the children; for each field the tag
+                    # listed first in _CHANNEL_FIELD_TAGS wins
+                    fields = {}
+                    for child in channel:
+                        field = _CHANNEL_FIELD_BY_TAG.get(child.tag.rpartition("}")[2])
+                        if field is not None:
+                            name, rank = field
+                            if name not in fields or rank < fields[name][0]:
+                                fields[name] = (rank, child.text)
+
+                    if "id" in fields:
+                        channel_id = fields["id"][1]
+                        name = fields.get("name", (None, f"Camera {channel_id}"))[1]
+                        enabled = fields.get("enabled", (None, "true"))[1]
+                        camera_info = {
+                            "id": int(channel_id),
+                            "name": name,
+                            "enabled": enabled.lower() == "true",
+                        }
+                        camera_list.append(camera_info)
+
+                return camera_list
 
-                # Add timeSpanList for a recent time period
-                time_span_list = SubElement(search_request, "timeSpanList")
-                time_span = SubElement(time_span_list, "timeSpan")
+        except Exception:
+            pass
 
-                # Search for the last hour
-                from datetime import datetime, timedelta
-                now = datetime.utcnow()
-                one_hour_ago = now - timedelta(hours=1)
+        return None
 
-                start_time = SubElement(time_span, "startTime")
-                start_time.text = one_hour_ago.strftime("%Y-%m-%dT%H:%M:%SZ")
+    @classmethod
+    def detect_available_cameras(cls, auth_handler, cam_ip, max_channels=10):
+        """Detect available cameras by testing video search on different channels."""
+        # Channel 0 is usually the grid view, 1-9 are individual cameras.
+        # Probes are independent, so they run concurrently within the NVR's stream limit.
+        with ThreadPoolExecutor(max_workers=min(max_channels, MAX_PARALLEL_NVR_STREAMS)) as executor:
+            results = executor.map(
+                partial(cls.probe_camera_channel, auth_handler, cam_ip), range(max_channels),
+            )
+            available_cameras = [camera_info for camera_info in results if camera_info is not None]
 
-                end_time = SubElement(time_span, "endTime")
-                end_time.text = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return available_cameras if available_cameras else None
 
-                request_data = ElementTree.tostring(search_request, encoding="utf8", method="xml")
+    @classmethod
+    def probe_camera_channel(cls, auth_handler, cam_ip, channel):
+        """Test video search on a single channel; return its camera info or None."""
+        try:
+            # Search the last hour; track IDs are a 2-digit channel + "01"
+            from datetime import datetime, timedelta
+            now = datetime.utcnow()
+            one_hour_ago = now - timedelta(hours=1)
+
+            request_data = _PROBE_TEMPLATE % (
+                _next_search_id(),
+                _xml_text(f"{channel:02d}01"),
+                _xml_text(one_hour_ago.strftime("%Y-%m-%dT%H:%M:%SZ")),
+                _xml_text(now.strftime("%Y-%m-%dT%H:%M:%SZ")),
+            )
 
+            with nvr_stream_slot(cam_ip):
                 answer = cls.__make_post_request(auth_handler, cam_ip, cls.__SEARCH_VIDEO_URL, request_data)
 
-                if answer and answer.ok:
-                    # If we get a successful response, this channel exists
-                    camera_info = {
-                        "id": channel,
-                        "name": f"Camera {channel}" if channel > 0 else "Grid View",
-                        "enabled": True,
-                    }
-                    available_cameras.append(camera_info)
+            if answer and answer.ok:
+                # If we get a successful response, this channel exists
+                return {
+                    "id": channel,
+                    "name": f"Camera {channel}" if channel > 0 else "Grid View",
+                    "enabled": True,
+                }
 
-            except Exception:
-                continue
+        except Exception:
+            pass
 
-        return available_cameras if available_cameras else None
+        return None
 
     @staticmethod
     def get_auth(auth_type, name, password):
@@ -303,34 +490,28 @@ class CameraSdk:
 
     @classmethod
     def download_file(cls, auth_handler, cam_ip, file_uri, file_name):
-        download_request = Element("downloadRequest")
-
-        # Add playbackURI
-        playback_uri = SubElement(download_request, "playbackURI")
-        playback_uri.text = file_uri
-
-        request_data = ElementTree.tostring(
-            download_request, encoding="utf8", method="xml",
-        )
+        request_data = _DOWNLOAD_TEMPLATE % _xml_text(file_uri)
 
         url = cls.__get_service_url(cam_ip, cls.__DOWNLOAD_VIDEO_URL)
         try:
-            answer = requests.get(
+            answer = cls.get_session().get(
                 url=url,
                 auth=auth_handler,
                 data=request_data,
                 stream=True,
                 timeout=cls.default_timeout_seconds,
             )
-            if answer and answer.ok:
-                with open(file_name, "wb") as out_file:
-                    shutil.copyfileobj(answer.raw, out_file)
-                answer.close()
-                return True
-            return False
+            # The response is returned either way so callers can inspect
+            # status_code; it is truthy only when the download succeeded
+            with answer:
+                if answer.ok:
+                    answer.raw.decode_content = True
+                    with open(file_name, "wb", buffering=0) as out_file:
+                        shutil.copyfileobj(answer.raw, out_file, _DOWNLOAD_COPY_BUFFER_SIZE)
+            return answer
 
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
-            return False
+            return None
 
     @classmethod
     def wait_until_camera_rebooted(
@@ -344,115 +525,126 @@ class CameraSdk:
         duration = (
             camera_reboot_time_seconds - delay_before_checking_availability_seconds
         )
-        tmax = time.time() + duration
-        while time.time() < tmax:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(cls.default_timeout_seconds)
-            try:
-                s.connect((cam_ip, int(cls.__CAMERA_AVAILABILITY_TEST_PORT)))
-                s.shutdown(socket.SHUT_RDWR)
-                return True
-            except OSError:
-                time.sleep(1)
-            finally:
+        deadline = time.monotonic() + duration
+        address = (cam_ip, int(cls.__CAMERA_AVAILABILITY_TEST_PORT))
+        backoff = cls.__REBOOT_POLL_MIN_SECONDS
+        s = None
+        connect_started = 0.0
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if s is None:
+                    s = cls.__start_connect(address)
+                    connect_started = time.monotonic()
+                # A connect still in flight keeps its socket across waits, up to
+                # __REBOOT_CONNECT_MAX_SECONDS; a refused one is retried after a pause
+                if s is not None and _wait_writable(s, min(backoff, remaining)):
+                    if s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        s.shutdown(socket.SHUT_RDWR)
+                        return True
+                    s.close()
+                    s = None
+                elif s is not None:
+                    if time.monotonic() - connect_started >= cls.__REBOOT_CONNECT_MAX_SECONDS:
+                        s.close()
+                        s = None
+                    backoff = min(backoff * 2, cls.__REBOOT_POLL_MAX_SECONDS)
+                    continue
+                time.sleep(max(0, min(backoff, deadline - time.monotonic())))
+                backoff = min(backoff * 2, cls.__REBOOT_POLL_MAX_SECONDS)
+        except OSError:
+            return False
+        finally:
+            if s is not None:
                 s.close()
-        return False
 
     @classmethod
-    def get_video_tracks_info(cls, auth_handler, cam_ip, utc_time_interval, max_videos, camera_channel=1):
-        # Create the root element
-        cm_search_description = Element("CMSearchDescription")
-
-        # Add searchID
-        search_id = SubElement(cm_search_description, "searchID")
-        search_id.text = str(uuid.uuid4())  # Generate a unique search ID
-
-        # Add trackIDList
-        track_id_list = SubElement(cm_search_description, "trackIDList")
-        track_id = SubElement(track_id_list, "trackID")
-        track_id.text = f"{camera_channel}01"
+    def is_reachable(cls, cam_ip, timeout=1.0):
+        """Return True if a TCP connection to the camera's HTTP port succeeds within timeout."""
+        host, _, port = cam_ip.partition(":")
+        try:
+            with socket.create_connection(
+                (host, int(port or cls.__CAMERA_AVAILABILITY_TEST_PORT)), timeout=timeout,
+            ):
+                return True
+        except (OSError, ValueError):
+            return False
 
-        # Add timeSpanList
-        time_span_list = SubElement(cm_search_description, "timeSpanList")
-        time_span = SubElement(time_span_list, "timeSpan")
+    @staticmethod
+    def __start_connect(address):
+        """Begin a non-blocking connect; return the socket, or None if it failed outright."""
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setblocking(False)
+        if s.connect_ex(address) in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+            return s
+        s.close()
+        return None
 
+    @classmethod
+    def get_video_tracks_info(cls, auth_handler, cam_ip, utc_time_interval, max_videos, camera_channel=1):
         start_time_tz_text, end_time_tz_text = utc_time_interval.to_tz_text()
-
-        start_time_element = SubElement(time_span, "startTime")
-        start_time_element.text = start_time_tz_text
-
-        end_time_element = SubElement(time_span, "endTime")
-        end_time_element.text = end_time_tz_text
-
-        # Add maxResults
-        max_results = SubElement(cm_search_description, "maxResults")
-        max_results.text = str(max_videos)
-
-        # Add searchResultPosition
-        search_result_position = SubElement(
-            cm_search_description, "searchResultPostion",
-        )
-        search_result_position.text = "0"
-
-        # Add metadataList
-        metadata_list = SubElement(cm_search_description, "metadataList")
-        metadata_descriptor = SubElement(metadata_list, "metadataDescriptor")
-        metadata_descriptor.text = "//recordType.meta.std-cgi.com"
-
-        request_data = ElementTree.tostring(
-            cm_search_description, encoding="utf8", method="xml",
+        request_data = _SEARCH_TEMPLATE % (
+            _next_search_id(),
+            _xml_text(f"{camera_channel}01"),
+            _xml_text(start_time_tz_text),
+            _xml_text(end_time_tz_text),
+            _xml_text(max_videos),
         )
+        # Streamed so create_tracks_from_info can parse while the body arrives
         answer = cls.__make_post_request(
-            auth_handler, cam_ip, cls.__SEARCH_VIDEO_URL, request_data,
+            auth_handler, cam_ip, cls.__SEARCH_VIDEO_URL, request_data, stream=True,
         )
 
         return answer
 
     @classmethod
     def create_tracks_from_info(cls, answer, local_time_offset):
-        answer_text = cls.__clear_xml_from_namespaces(answer.text)
-        answer_xml = ElementTree.fromstring(answer_text)
-
-        match_list = answer_xml.find("matchList")
-        if match_list is None:
-            # No videos found in the specified time range
-            return []
-
-        match_items = match_list.findall("searchMatchItem")
-
+        # Parse the streamed body in one pass; tags keep their namespace, so
+        # match on the local name. No matchList means no videos were found.
+        answer.raw.decode_content = True
         tracks = []
-        for match_item in match_items:
-            media_descriptor = match_item.find("mediaSegmentDescriptor")
-            playback_uri = media_descriptor.find("playbackURI")
-            new_track = Track(playback_uri.text, local_time_offset)
-            tracks.append(new_track)
+        try:
+            for _, element in ElementTree.iterparse(answer.raw, events=("end",)):
+                tag = element.tag.rpartition("}")[2]
+                if tag == "playbackURI":
+                    tracks.append(Track(element.text, local_time_offset))
+                elif tag == "searchMatchItem":
+                    element.clear()
+        finally:
+            answer.close()
 
         return tracks
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def __get_service_url(cam_ip, relative_url):
         return "http://" + cam_ip + relative_url
 
-    @staticmethod
-    def __clear_xml_from_namespaces(xml_text):
-        return re.sub(' xmlns="[^"]+"', "", xml_text, count=0)
-
     @classmethod
     def __make_get_request(cls, auth_handler, cam_ip, url):
-        return requests.get(
+        answer = cls.get_session().get(
             url=cls.__get_service_url(cam_ip, url),
             auth=auth_handler,
             timeout=cls.default_timeout_seconds,
         )
+        if answer.status_code == HTTPStatus.UNAUTHORIZED:
+            cls.invalidate_cache(cam_ip)
+        return answer
 
     @classmethod
-    def __make_post_request(cls, auth_handler, cam_ip, url, request_data):
-        return requests.post(
+    def __make_post_request(cls, auth_handler, cam_ip, url, request_data, stream=False):
+        answer = cls.get_session().post(
             url=cls.__get_service_url(cam_ip, url),
             auth=auth_handler,
             data=request_data,
+            stream=stream,
             timeout=cls.default_timeout_seconds,
         )
+        if answer.status_code == HTTPStatus.UNAUTHORIZED:
+            cls.invalidate_cache(cam_ip)
+        return answer
 
     @staticmethod
     def __replace_subelement_with(parent, new_subelement):
@@ -488,23 +680,67 @@ def init(cam_ip, camera_channel=1, verbose_level=0):
 
 @logging_wrapper(before=LogPrinter.get_all_tracks)
 def get_all_tracks(auth_handler, cam_ip, utc_time_interval, camera_channel=1):
+    # Pagination is serial (each page starts where the previous one ended), so
+    # long intervals are split up front and the pieces are searched in parallel
+    sub_intervals = split_time_interval(utc_time_interval)
+    if len(sub_intervals) == 1:
+        tracks = get_tracks_in_interval(auth_handler, cam_ip, utc_time_interval, camera_channel)
+        return tracks if tracks is not None else []
+
+    with ThreadPoolExecutor(max_workers=len(sub_intervals)) as executor:
+        results = list(executor.map(
+            lambda interval: get_tracks_in_interval(auth_handler, cam_ip, interval, camera_channel),
+            sub_intervals,
+        ))
+    if any(result is None for result in results):
+        return []
+
+    # Tracks spanning a split point are returned by both neighbours
+    tracks = []
+    seen_urls = set()
+    for result in results:
+        for track in result:
+            url = track.url_to_download()
+            if url not in seen_urls:
+                seen_urls.add(url)
+                tracks.append(track)
+    return tracks
+
+
+def split_time_interval(utc_time_interval):
+    duration = utc_time_interval.end_time - utc_time_interval.start_time
+    parts = int(min(MAX_PARALLEL_TRACK_SEARCHES, duration // MIN_PARALLEL_SEARCH_INTERVAL))
+    if parts <= 1:
+        return [utc_time_interval]
+
+    step = duration / parts
+    boundaries = [utc_time_interval.start_time + step * i for i in range(parts)]
+    boundaries.append(utc_time_interval.end_time)
+    return [
+        TimeInterval(start, end, utc_time_interval.local_time_offset)
+        for start, end in zip(boundaries, boundaries[1:])
+    ]
+
+
+def get_tracks_in_interval(auth_handler, cam_ip, utc_time_interval, camera_channel=1):
+    """Page through one interval; return its tracks, or None if a search failed."""
     tracks = []
     while True:
-        answer = get_video_tracks_info(auth_handler, cam_ip, utc_time_interval, camera_channel)
-        local_time_offset = utc_time_interval.local_time_offset
-        if answer:
+        # The streamed answer stays open until its tracks are parsed
+        with nvr_stream_slot(cam_ip):
+            answer = get_video_tracks_info(auth_handler, cam_ip, utc_time_interval, camera_channel)
+            if not answer:
+                answer.close()
+                return None
+            local_time_offset = utc_time_interval.local_time_offset
             new_tracks = CameraSdk.create_tracks_from_info(answer, local_time_offset)
-            tracks += new_tracks
-            if len(new_tracks) < MAX_VIDEOS_NUMBER_IN_ONE_REQUEST:
-                break
 
-            last_track = tracks[-1]
-            utc_time_interval.start_time = last_track.get_time_interval().end_time
-        else:
-            tracks = []
-            break
+        tracks += new_tracks
+        if len(new_tracks) < MAX_VIDEOS_NUMBER_IN_ONE_REQUEST:
+            return tracks
 
-    return tracks
+        last_track = tracks[-1]
+        utc_time_interval.start_time = last_track.get_time_interval().end_time
 
 
 @logging_wrapper(after=LogPrinter.get_video_tracks_info)
@@ -1,21 +1,30 @@
-import argparse
+import os
 import sys
-from argparse import Namespace
-from typing import Optional
-
-from .camerasdk import CameraSdk
-from .config import (
-    ConfigManager,
-    list_configured_devices,
-    remove_device_setup,
-    setup_device,
-)
-from .date_parser import FlexibleDateParser
-from .work import work
-
-
-def parse_parameters() -> Optional[Namespace]:
-    usage = """
+from datetime import datetime
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import argparse
+    from argparse import Namespace
+
+from . import __version__
+
+_SHORT_HELP = """\
+usage: {prog} [--setup|--list-devices|--remove-device|--status] [--device DEVICE|--camera CAMERA] [CAM_IP] START_DATETIME [END_DATETIME]
+
+Run '{prog} --help' for the full list of options and examples.
+"""
+
+# Flags that are complete commands on their own, mapped to their dest
+_ACTION_FLAGS = {
+    "--setup": "setup",
+    "--list-devices": "list_devices",
+    "--remove-device": "remove_device",
+}
+
+_USAGE = """
   %(prog)s [--setup|--list-devices|--remove-device|--status] [-u] [--device DEVICE|--camera CAMERA] [CAM_IP] START_DATETIME [END_DATETIME]
   
   If END_DATETIME isn't specified use now().
@@ -36,7 +45,7 @@ def parse_parameters() -> Optional[Namespace]:
     - Combined: "8 AM yesterday", "August 30, 2025 08:00 AM"
   """
 
-    epilog = """
+_EPILOG = """
 Examples:
   # Setup a new device
   laview-cli --setup
@@ -65,8 +74,17 @@ Examples:
   
         """
 
+_PARSER: Optional["argparse.ArgumentParser"] = None
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the command line parser; only called when there is argv to parse."""
+    import argparse
+
+    # The epilog is set per call by parse_parameters()
     parser = argparse.ArgumentParser(
-        usage=usage, epilog=epilog, formatter_class=argparse.RawDescriptionHelpFormatter,
+        usage=_USAGE,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
     # Setup commands
@@ -84,8 +102,7 @@ Examples:
     parser.add_argument(
         "END_DATETIME",
         nargs="?",
-        help="end datetime",
-        default="now",
+        help="end datetime (default: now)",
     )
     parser.add_argument(
         "--camera",
@@ -94,39 +111,71 @@ Examples:
         help="camera channel number (default: 1, only used when not using --device)",
     )
 
+    parser.add_argument("-V", "--version", action="version", version=f"%(prog)s {__version__}")
+
     # Verbose levels
     parser.add_argument("-v", "--verbose", action="count", default=0,
                        help="Increase verbosity (-v: GOSSIP, -vv: BANTER, -vvv: WHISPER, -vvvv: HINT, -vvvvv: TRACE)")
 
+    return parser
+
+
+def _get_parser() -> "argparse.ArgumentParser":
+    """Return the command line parser, building it on first use."""
+    global _PARSER  # noqa: PLW0603
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _sniff_action(argv: list[str]) -> Optional[SimpleNamespace]:
+    """Return the arguments for a lone action flag, or None if argparse is needed."""
+    # Handled without importing argparse at all; main() only reads attributes
+    if len(argv) != 1 or argv[0] not in _ACTION_FLAGS:
+        return None
+    args = SimpleNamespace(
+        setup=False, list_devices=False, remove_device=False, status=False, device=None,
+        IP=None, START_DATETIME=None, END_DATETIME=None, camera=1, verbose=0,
+    )
+    setattr(args, _ACTION_FLAGS[argv[0]], True)
+    return args
+
+
+def parse_parameters() -> Optional["Namespace"]:
+    # Answer the introspection-only invocations without building the parser
     if len(sys.argv) == 1:
-        parser.print_help()
+        sys.stdout.write(_SHORT_HELP.format(prog=os.path.basename(sys.argv[0])))
+        return None
+    if sys.argv[1] in ("-V", "--version"):
+        print(f"{os.path.basename(sys.argv[0])} {__version__}")
         return None
-    args = parser.parse_args()
 
-    # Fix argument parsing for device mode
+    # Lone action flags need no positional parsing either
+    args = _sniff_action(sys.argv[1:])
+    if args is not None:
+        return args
+
+    # The examples epilog is only ever shown by --help; set on every call as
+    # the parser is shared
+    parser = _get_parser()
+    wants_help = any(arg in ("-h", "--help") for arg in sys.argv[1:])
+    parser.epilog = _EPILOG if wants_help else None
+
+    # Intermixed so options may follow the datetimes, e.g. "... yesterday -v now"
+    args = parser.parse_intermixed_args()
+
+    # Device mode takes no IP, so argparse's positionals are shifted by one
     if args.device:
-        # Extract datetime arguments from sys.argv
-        device_found = False
-        datetime_args = []
-        for arg in sys.argv:
-            if arg == "--device":
-                device_found = True
-                continue
-            if device_found and arg != args.device:
-                datetime_args.append(arg)
-
-        # Set the datetime arguments correctly
-        if len(datetime_args) >= 1:
-            args.START_DATETIME = datetime_args[0]
-        if len(datetime_args) >= 2:
-            args.END_DATETIME = datetime_args[1]
-        else:
-            args.END_DATETIME = "now"
+        positionals = [
+            value for value in (args.IP, args.START_DATETIME, args.END_DATETIME) if value is not None
+        ]
+        args.IP = None
+        args.START_DATETIME, args.END_DATETIME = (positionals + [None, None])[:2]
 
     return args
 
 
-def validate_legacy_args(args: Namespace) -> bool:
+def validate_legacy_args(args: "Namespace") -> bool:
     """Validate that required arguments are provided for legacy mode."""
     if not args.IP or not args.START_DATETIME:
         print("Error: IP and START_DATETIME are required when not using --device")
@@ -134,48 +183,63 @@ def validate_legacy_args(args: Namespace) -> bool:
     return True
 
 
+@lru_cache(maxsize=32)
 def get_device_config(device_name: str) -> Optional[dict]:
-    """Get configuration for a specific device."""
+    """
+    Get configuration for a specific device.
+
+    Results are memoized for the life of the process, assuming devices.toml
+    is not edited externally while the CLI runs; call
+    get_device_config.cache_clear() after changing the stored devices.
+    """
+    from .config import ConfigManager
+
     config_manager = ConfigManager()
     return config_manager.get_device_config(device_name)
 
 
-def parse_datetime_strings(start_datetime: str, end_datetime: str) -> tuple[str, str]:
+def parse_datetime_strings(start_datetime: str, end_datetime: Optional[str]) -> tuple[str, str]:
     """
     Parse datetime strings into formatted datetime strings.
     
     Args:
         start_datetime: Start datetime string
-        end_datetime: End datetime string
+        end_datetime: End datetime string, or None for the current time
         
     Returns:
         Tuple of (start_datetime_str, end_datetime_str)
     """
-    try:
-        # Parse start datetime
-        start_dt = FlexibleDateParser.parse_datetime(start_datetime)
-        start_datetime_str = start_dt.strftime("%Y-%m-%d %H:%M:%S")
-    except ValueError as e:
-        print(f"Error parsing start datetime: {e}")
-        print(f"Start datetime: '{start_datetime}'")
-        print("Supported formats:")
-        for fmt in FlexibleDateParser.get_supported_formats()[:5]:  # Show first 5 formats
-            print(f"  - {fmt}")
-        raise
+    start_datetime_str = _parse_one_datetime("start", start_datetime)
+    # An omitted end means now and needs no parsing
+    if end_datetime is None:
+        end_datetime_str = _format_datetime(datetime.now())
+    else:
+        end_datetime_str = _parse_one_datetime("end", end_datetime)
+
+    return start_datetime_str, end_datetime_str
+
+
+def _parse_one_datetime(label: str, text: str) -> str:
+    """Parse one datetime argument, printing the supported formats on failure."""
+    from .date_parser import FlexibleDateParser
 
     try:
-        # Parse end datetime
-        end_dt = FlexibleDateParser.parse_datetime(end_datetime)
-        end_datetime_str = end_dt.strftime("%Y-%m-%d %H:%M:%S")
+        return _format_datetime(FlexibleDateParser.parse_datetime(text))
     except ValueError as e:
-        print(f"Error parsing end datetime: {e}")
-        print(f"End datetime: '{end_datetime}'")
+        print(f"Error parsing {label} datetime: {e}")
+        print(f"{label.capitalize()} datetime: '{text}'")
         print("Supported formats:")
-        for fmt in FlexibleDateParser.get_supported_formats()[:5]:  # Show first 5 formats
+        for fmt in FlexibleDateParser.SUPPORTED_HEAD:
             print(f"  - {fmt}")
         raise
 
-    return start_datetime_str, end_datetime_str
+
+def _format_datetime(value: datetime) -> str:
+    """Format as "%Y-%m-%d %H:%M:%S", the form work() expects."""
+    return (
+        f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+        f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+    )
 
 
 def test_device_status(device_name: str) -> None:
@@ -185,9 +249,8 @@ def test_device_status(device_name: str) -> None:
     Args:
         device_name: Name of the configured device to test
     """
-    import os
-
     from .authtype import AuthType
+    from .camerasdk import CameraSdk
 
     device_config = get_device_config(device_name)
     if not device_config:
@@ -223,10 +286,18 @@ def test_device_status(device_name: str) -> None:
     print(f"Password: {'*' * len(password)}")
     print()
 
+    # A cheap TCP check first, so an offline device fails fast instead of
+    # waiting out the HTTP timeout
+    if not CameraSdk.is_reachable(camera_ip):
+        print("❌ Device unreachable: no TCP connection")
+        print("\nDevice status: OFFLINE (TCP unreachable)")
+        return
+
     try:
-        # Test authentication
+        # Test authentication; the probe cache is skipped so that the
+        # credentials are checked against the device itself
         print("Testing authentication...")
-        auth_type = CameraSdk.get_auth_type(camera_ip, username, password)
+        auth_type = CameraSdk.get_auth_type(camera_ip, username, password, use_cache=False)
 
         if auth_type == AuthType.UNAUTHORISED:
             print("❌ Authentication failed: Invalid credentials")
@@ -239,7 +310,7 @@ def test_device_status(device_name: str) -> None:
         # Test connectivity by getting system time
         print("Testing connectivity...")
         auth_handler = CameraSdk.get_auth(auth_type, username, password)
-        time_offset = CameraSdk.get_time_offset(auth_handler, camera_ip)
+        time_offset = CameraSdk.get_time_offset(auth_handler, camera_ip, use_cache=False)
 
         print("✅ Connectivity successful")
         print(f"Device timezone offset: {time_offset}")
@@ -258,15 +329,23 @@ def main():
 
     # Handle setup commands
     if parameters.setup:
+        from .config import setup_device
+
         setup_device()
+        get_device_config.cache_clear()
         return
 
     if parameters.list_devices:
+        from .config import list_configured_devices
+
         list_configured_devices()
         return
 
     if parameters.remove_device:
+        from .config import remove_device_setup
+
         remove_device_setup()
+        get_device_config.cache_clear()
         return
 
     if parameters.status:
@@ -291,17 +370,20 @@ def main():
         camera_channel = device_config.get("camera_channel", 1)
 
         # Set environment variables if credentials are stored
-        if device_config.get("username"):
-            import os
-            os.environ["LAVIEW_NVR_USER"] = device_config["username"]
+        os.environ.update({
+            env_name: value
+            for env_name, value in (
+                ("LAVIEW_NVR_USER", device_config.get("username")),
+                ("LAVIEW_NVR_PASS", device_config.get("password")),
+            )
+            if value
+        })
 
-        if device_config.get("password"):
-            import os
-            os.environ["LAVIEW_NVR_PASS"] = device_config["password"]
+        from .camerasdk import CameraSdk, init
+        from .work import work
 
         # Set timeout if configured
         if device_config.get("timeout"):
-            from .camerasdk import CameraSdk
             CameraSdk.init(device_config["timeout"])
 
         # Check if we have the required arguments
@@ -312,7 +394,6 @@ def main():
 
         try:
             # Initialize logger with verbose level
-            from .camerasdk import init
             init(camera_ip, camera_channel, verbose_level=parameters.verbose)
 
             # Parse the datetime strings using flexible parser
@@ -335,13 +416,15 @@ def main():
     if not validate_legacy_args(parameters):
         return
 
+    from .camerasdk import init
+    from .work import work
+
     try:
         parameters.utc = True
         camera_ip = parameters.IP
         camera_channel = parameters.camera
 
         # Initialize logger with verbose level
-        from .camerasdk import init
         init(camera_ip, camera_channel, verbose_level=parameters.verbose)
 
         # Parse the datetime strings using flexible parser
@@ -7,30 +7,93 @@ Supports both TOML and JSON formats for backward compatibility.
 
 import json
 import os
+import stat
+import tempfile
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, ClassVar, Dict, Optional, Set, Tuple
+
+# The TOML modules are imported on first use: tomllib compiles its regexes at
+# import time, and warm loads are served from the caches without parsing.
+_TOML_READER_MODULES = (
+    "tomllib",  # Built-in in Python 3.11+ for reading
+    "tomli",  # The same parser, backported to older Pythons
+)
+_TOML_WRITER_MODULE = "tomli_w"  # For writing TOML files
+
+
+@lru_cache(maxsize=1)
+def _toml_available() -> bool:
+    """
+    Check, without importing them, that TOML can be both read and written.
+
+    Both are required, otherwise devices.toml could go stale while saves fall
+    back to JSON.
+    """
+    return (
+        any(find_spec(name) is not None for name in _TOML_READER_MODULES)
+        and find_spec(_TOML_WRITER_MODULE) is not None
+    )
+
+
+@lru_cache(maxsize=1)
+def _toml_reader() -> Any:
+    for name in _TOML_READER_MODULES:
+        try:
+            return import_module(name)
+        except ImportError:
+            continue
+    raise ImportError("No TOML parser available")
+
+
+@lru_cache(maxsize=1)
+def _toml_writer() -> Any:
+    return import_module(_TOML_WRITER_MODULE)
+
+
+def _toml_dumps(config: Dict[str, Any]) -> bytes:
+    """
+    Serialize config as TOML with each device's fields in sorted order.
+
+    Devices keep their insertion order, which list_devices reports.
+    """
+    config = {
+        name: dict(sorted(fields.items())) if isinstance(fields, dict) else fields
+        for name, fields in config.items()
+    }
+    return _toml_writer().dumps(config, multiline_strings=False).encode("utf-8")
+
 
 try:
-    import tomli_w  # For writing TOML files
-    import tomllib  # Built-in in Python 3.11+ for reading
-    TOML_AVAILABLE = True
-    TOML_READER = tomllib
-    TOML_WRITER = tomli_w
+    import orjson  # Optional, faster JSON parsing and serialization
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(config: Dict[str, Any]) -> bytes:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
 except ImportError:
-    try:
-        import toml  # Fallback to external toml library
-        TOML_AVAILABLE = True
-        TOML_READER = toml
-        TOML_WRITER = toml
-    except ImportError:
-        TOML_AVAILABLE = False
-        TOML_READER = None
-        TOML_WRITER = None
+    _json_loads = json.loads
+
+    def _json_dumps(config: Dict[str, Any]) -> bytes:
+        return json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _default_config_dir() -> Path:
+    return Path.home() / ".config" / "laview-nvr-video-downloader"
 
 
 class ConfigManager:
     """Manages configuration for laview-nvr-video-downloader devices."""
 
+    # Parsed configs keyed by (path, st_mtime_ns, st_size), shared by all
+    # instances so repeated lookups in one process skip re-parsing.
+    _cache: ClassVar[Dict[Tuple[str, int, int], Dict[str, Any]]] = {}
+    # Directories already created by this process
+    _ensured_dirs: ClassVar[Set[Path]] = set()
+
     def __init__(self, config_dir: Optional[str] = None):
         """
         Initialize the configuration manager.
@@ -39,18 +102,34 @@ class ConfigManager:
             config_dir: Directory to store configuration files. 
                        Defaults to ~/.config/laview-nvr-video-downloader
         """
-        if config_dir is None:
-            config_dir = os.path.expanduser("~/.config/laview-nvr-video-downloader")
-
-        self.config_dir = Path(config_dir)
+        self.config_dir = _default_config_dir() if config_dir is None else Path(config_dir)
         # Use TOML as primary format, with JSON fallback
         self.config_file = self.config_dir / "devices.toml"
         self.json_config_file = self.config_dir / "devices.json"
+        # Changes made inside a `with` block are written once, on exit
+        self._batch_depth = 0
+        self._pending: Optional[Dict[str, Any]] = None
         self._ensure_config_dir()
 
+    def __enter__(self) -> "ConfigManager":
+        """Start batching: saves are deferred until the outermost block exits."""
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Write any deferred changes, unless the block raised."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._pending is not None:
+            config, self._pending = self._pending, None
+            if exc_type is None:
+                self._save_config(config)
+
     def _ensure_config_dir(self) -> None:
         """Ensure the configuration directory exists."""
+        if self.config_dir in self._ensured_dirs:
+            return
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(self.config_dir)
 
     def get_device_config(self, device_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -75,17 +154,25 @@ class ConfigManager:
         """
         config = self._load_config()
         config[device_name] = config_data
-        self._save_config(config)
+        self._commit(config)
 
-    def list_devices(self) -> list[str]:
+    def list_devices(self) -> Tuple[str, ...]:
         """
         List all configured device names.
         
         Returns:
-            List of device names
+            Tuple of device names
         """
-        config = self._load_config()
-        return list(config.keys())
+        return tuple(self._load_config())
+
+    def items(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get every configured device in one load.
+        
+        Returns:
+            Mapping of device name to its configuration
+        """
+        return self._load_config()
 
     def remove_device(self, device_name: str) -> bool:
         """
@@ -100,56 +187,192 @@ class ConfigManager:
         config = self._load_config()
         if device_name in config:
             del config[device_name]
-            self._save_config(config)
+            self._commit(config)
             return True
         return False
 
+    def _commit(self, config: Dict[str, Any]) -> None:
+        """Save config now, or keep it for the end of the current batch."""
+        if self._batch_depth:
+            self._pending = config
+        else:
+            self._save_config(config)
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file. Supports TOML and JSON formats."""
+        if self._pending is not None:
+            return dict(self._pending)
+
         # Try TOML first (preferred format)
-        if self.config_file.exists() and TOML_AVAILABLE:
+        if _toml_available():
             try:
-                with open(self.config_file, "rb") as f:
-                    return TOML_READER.load(f)
-            except (OSError, Exception):
+                return self._read_cached(self.config_file, self._read_toml)
+            except (OSError, ValueError):  # ValueError covers TOMLDecodeError
                 pass
 
         # Fallback to JSON if TOML fails or not available
-        if self.json_config_file.exists():
-            try:
-                with open(self.json_config_file, encoding="utf-8") as f:
-                    config = json.load(f)
-                    # Migrate to TOML format
-                    self._migrate_to_toml(config)
-                    return config
-            except (OSError, json.JSONDecodeError):
-                pass
+        try:
+            config = self._read_cached(self.json_config_file, self._read_json)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        # Migrate to TOML format, unless an earlier migration already did
+        if not self._is_migrated():
+            self._migrate_to_toml(config)
+        return config
+
+    def _is_migrated(self) -> bool:
+        """Check whether devices.toml is at least as new as devices.json."""
+        try:
+            return self.config_file.stat().st_mtime_ns >= self.json_config_file.stat().st_mtime_ns
+        except OSError:
+            return False
+
+    @classmethod
+    def _read_cached(
+        cls, path: Path, reader: Callable[[Path], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Return the parsed contents of path, reusing the cached parse if unchanged.
+
+        Args:
+            path: Configuration file to read
+            reader: Callable that parses the file into a dictionary
 
-        return {}
+        Returns:
+            Shallow copy of the parsed configuration
+
+        Raises:
+            FileNotFoundError: If path does not exist
+        """
+        st = path.stat()
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        config = cls._cache.get(key)
+        if config is None:
+            config = reader(path)
+            cls._invalidate(path)
+            cls._cache[key] = config
+        return dict(config)
+
+    @classmethod
+    def _invalidate(cls, path: Path) -> None:
+        """Drop every cached parse of path."""
+        path_str = str(path)
+        for key in [key for key in cls._cache if key[0] == path_str]:
+            del cls._cache[key]
+
+    @staticmethod
+    def _read_toml(path: Path) -> Dict[str, Any]:
+        with open(path, "rb") as f:
+            return _toml_reader().load(f)
+
+    @staticmethod
+    def _read_json(path: Path) -> Dict[str, Any]:
+        return _json_loads(path.read_bytes())
 
     def _migrate_to_toml(self, config: Dict[str, Any]) -> None:
         """Migrate JSON configuration to TOML format."""
-        if TOML_AVAILABLE and config:
+        if _toml_available() and config:
             try:
-                with open(self.config_file, "wb") as f:
-                    TOML_WRITER.dump(config, f)
+                self._atomic_write(self.config_file, _toml_dumps(config))
+                self._invalidate(self.config_file)
                 # Backup the old JSON file
-                if self.json_config_file.exists():
-                    backup_file = self.json_config_file.with_suffix(".json.backup")
-                    self.json_config_file.rename(backup_file)
+                try:
+                    self.json_config_file.rename(self.json_config_file.with_suffix(".json.backup"))
+                except FileNotFoundError:
+                    pass
             except Exception:
                 # If migration fails, keep using JSON
                 pass
 
     def _save_config(self, config: Dict[str, Any]) -> None:
         """Save configuration to file. Uses TOML format if available."""
-        if TOML_AVAILABLE:
-            with open(self.config_file, "wb") as f:
-                TOML_WRITER.dump(config, f)
+        if _toml_available():
+            path, data = self.config_file, _toml_dumps(config)
         else:
             # Fallback to JSON if TOML not available
-            with open(self.json_config_file, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            path, data = self.json_config_file, _json_dumps(config)
+
+        # Leave an unchanged file alone so its mtime-keyed caches stay valid
+        try:
+            if path.read_bytes() == data:
+                return
+        except OSError:
+            pass
+
+        self._invalidate(path)
+        self._atomic_write(path, data)
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        """
+        Write data to a temporary sibling of path and rename it into place.
+
+        The file keeps the mode of the file it replaces; new files are created
+        0600 since device configs may hold passwords.
+        """
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+
+        # mkstemp creates a uniquely named 0600 file, so concurrent saves
+        # never share a temporary file
+        fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+        try:
+            # Unbuffered: the serialized config goes out in one write(2)
+            with open(fd, "wb", buffering=0) as f:
+                view = memoryview(data)
+                while view:
+                    view = view[f.write(view):]
+                os.fsync(f.fileno())
+            # os.chmod, not os.fchmod, which Windows lacks before Python 3.13
+            if mode != 0o600:
+                os.chmod(tmp_name, mode)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+
+def _is_positive(value: int) -> bool:
+    return value > 0
+
+
+def _prompt(
+    message: str,
+    error: str,
+    cast: Callable[[str], Any] = str,
+    is_valid: Callable[[Any], bool] = bool,
+    default: Any = None,
+) -> Any:
+    """
+    Prompt until the user enters a valid value.
+
+    Args:
+        message: Prompt shown to the user
+        error: Message printed when the value fails is_valid
+        cast: Converts the stripped input; ValueError means invalid
+        is_valid: Predicate the converted value must satisfy
+        default: Returned for empty input when not None
+
+    Returns:
+        The converted value
+    """
+    while True:
+        raw = input(message).strip()
+        if not raw and default is not None:
+            return default
+        try:
+            value = cast(raw)
+        except ValueError:
+            print("Please enter a valid number.")
+            continue
+        if is_valid(value):
+            return value
+        print(error)
 
 
 def prompt_for_device_config() -> Dict[str, Any]:
@@ -162,19 +385,14 @@ def prompt_for_device_config() -> Dict[str, Any]:
     print("=== LaView NVR Video Downloader Setup ===")
     print()
 
-    # Get device name
-    while True:
-        device_name = input("Enter device name (e.g., 'office-nvr', 'home-camera'): ").strip()
-        if device_name:
-            break
-        print("Device name cannot be empty. Please try again.")
-
-    # Get IP address
-    while True:
-        ip_address = input("Enter device IP address: ").strip()
-        if ip_address:
-            break
-        print("IP address cannot be empty. Please try again.")
+    device_name = _prompt(
+        "Enter device name (e.g., 'office-nvr', 'home-camera'): ",
+        "Device name cannot be empty. Please try again.",
+    )
+    ip_address = _prompt(
+        "Enter device IP address: ",
+        "IP address cannot be empty. Please try again.",
+    )
 
     # Get username
     username = input("Enter username (or press Enter to use environment variable LAVIEW_NVR_USER): ").strip()
@@ -182,33 +400,20 @@ def prompt_for_device_config() -> Dict[str, Any]:
     # Get password
     password = input("Enter password (or press Enter to use environment variable LAVIEW_NVR_PASS): ").strip()
 
-    # Get camera channel
-    while True:
-        camera_channel_input = input("Enter camera channel number (default: 1): ").strip()
-        if not camera_channel_input:
-            camera_channel = 1
-            break
-        try:
-            camera_channel = int(camera_channel_input)
-            if camera_channel > 0:
-                break
-            print("Camera channel must be a positive integer.")
-        except ValueError:
-            print("Please enter a valid number.")
-
-    # Get timeout
-    while True:
-        timeout_input = input("Enter timeout in seconds (default: 10): ").strip()
-        if not timeout_input:
-            timeout = 10
-            break
-        try:
-            timeout = int(timeout_input)
-            if timeout > 0:
-                break
-            print("Timeout must be a positive integer.")
-        except ValueError:
-            print("Please enter a valid number.")
+    camera_channel = _prompt(
+        "Enter camera channel number (default: 1): ",
+        "Camera channel must be a positive integer.",
+        cast=int,
+        is_valid=_is_positive,
+        default=1,
+    )
+    timeout = _prompt(
+        "Enter timeout in seconds (default: 10): ",
+        "Timeout must be a positive integer.",
+        cast=int,
+        is_valid=_is_positive,
+        default=10,
+    )
 
     config = {
         "device_name": device_name,
@@ -259,7 +464,7 @@ def setup_device() -> None:
 def list_configured_devices() -> None:
     """List all configured devices."""
     config_manager = ConfigManager()
-    devices = config_manager.list_devices()
+    devices = config_manager.items()
 
     if not devices:
         print("No devices configured.")
@@ -269,8 +474,7 @@ def list_configured_devices() -> None:
     print("Configured devices:")
     print()
 
-    for device_name in devices:
-        config = config_manager.get_device_config(device_name)
+    for device_name, config in devices.items():
         print(f"  {device_name}:")
         print(f"    IP: {config.get('ip_address', 'N/A')}")
         print(f"    Camera: {config.get('camera_channel', 'N/A')}")
@@ -6,14 +6,19 @@ the dateparser library, which handles natural language parsing much
 better than custom regex patterns.
 """
 
+import re
 from datetime import datetime
 
-from dateparser import parse as dateparser_parse
-
 
 class FlexibleDateParser:
     """A simple wrapper around dateparser for consistent interface."""
 
+    # "YYYY-MM-DD", optionally followed by " HH:MM[:SS]" or "THH:MM[:SS]",
+    # is parsed directly before falling back to dateparser
+    FAST_FORMAT = re.compile(
+        r"(\d{4})-(\d{1,2})-(\d{1,2})(?:[ T](\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?",
+    )
+
     @classmethod
     def parse_datetime(cls, text: str) -> datetime:
         """
@@ -30,7 +35,19 @@ class FlexibleDateParser:
         """
         text = text.strip()
 
-        # Use dateparser to parse the text
+        # Common exact formats and "now" skip dateparser entirely
+        if text == "now":
+            return datetime.now()
+        match = cls.FAST_FORMAT.fullmatch(text)
+        if match:
+            try:
+                return datetime(*(int(field) for field in match.groups() if field is not None))
+            except ValueError:
+                pass  # Out of range fields, e.g. month 13
+
+        # Use dateparser to parse the text; imported here as it is slow to load
+        from dateparser import parse as dateparser_parse
+
         result = dateparser_parse(text)
 
         if result is None:
@@ -38,14 +55,19 @@ class FlexibleDateParser:
 
         return result
 
+    # Shown to users by get_supported_formats(); SUPPORTED_HEAD is the short list
+    # printed with parse errors
+    SUPPORTED_FORMATS = (
+        "Natural language: today, yesterday, tomorrow, now",
+        "Relative: 2 days ago, next week, last month",
+        "Formatted: August 30, 2025, 08/30/2025, 30/08/2025",
+        "Combined: '8 AM yesterday', 'August 30, 2025 08:00 AM'",
+        "Time formats: 4:00PM, 4:00 PM, 16:00, 4:00:00 PM",
+        "And many more supported by dateparser library",
+    )
+    SUPPORTED_HEAD = SUPPORTED_FORMATS[:5]
+
     @classmethod
     def get_supported_formats(cls) -> list[str]:
         """Get a list of supported date/time formats."""
-        return [
-            "Natural language: today, yesterday, tomorrow, now",
-            "Relative: 2 days ago, next week, last month",
-            "Formatted: August 30, 2025, 08/30/2025, 30/08/2025",
-            "Combined: '8 AM yesterday', 'August 30, 2025 08:00 AM'",
-            "Time formats: 4:00PM, 4:00 PM, 16:00, 4:00:00 PM",
-            "And many more supported by dateparser library",
-        ]
+        return list(cls.SUPPORTED_FORMATS)
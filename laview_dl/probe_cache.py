@@ -0,0 +1,140 @@
+"""
+On-disk cache of per-camera probe results.
+
+Stores the detected authentication scheme and timezone offset of each NVR so
+that later runs can skip the probing requests. Entries are kept per set of
+credentials, so other credentials still get probed. Entries expire after a day.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+_KDF_ITERATIONS = 100_000
+
+
+@lru_cache(maxsize=16)
+def _derive_key(salt: str, user_name: str, password: str) -> str:
+    # Slow and salted, so the stored key is no shortcut to guessing a
+    # (typically weak) NVR password; memoized as a run derives it repeatedly
+    return hashlib.pbkdf2_hmac(
+        "sha256",
+        f"{user_name}\0{password}".encode("utf-8"),
+        bytes.fromhex(salt),
+        _KDF_ITERATIONS,
+    ).hex()
+
+
+class ProbeCache:
+    """JSON file mapping camera IP and credentials to cached probe results."""
+
+    TTL_SECONDS = 24 * 60 * 60
+
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Initialize the probe cache.
+
+        Args:
+            cache_file: Path of the JSON cache file.
+                        Defaults to ~/.cache/laview-nvr-video-downloader/probes.json
+        """
+        if cache_file is None:
+            cache_file = os.path.join(
+                os.path.expanduser("~/.cache/laview-nvr-video-downloader"), "probes.json",
+            )
+
+        self.cache_file = Path(cache_file)
+        self._lock = threading.Lock()
+
+    def get(self, cam_ip: str, user_name: str, password: str) -> Dict[str, Any]:
+        """
+        Get the cached probe results for a camera and credentials.
+
+        Args:
+            cam_ip: IP address of the camera
+            user_name: User name the results were probed with
+            password: Password the results were probed with
+
+        Returns:
+            Cached fields, or an empty dictionary if missing or expired
+        """
+        with self._lock:
+            cache = self._load()
+        entries = cache["cameras"].get(cam_ip)
+        if not isinstance(entries, dict):
+            return {}
+        entry = entries.get(_derive_key(cache["salt"], user_name, password))
+        if not isinstance(entry, dict) or time.time() - entry.get("cached_at", 0) > self.TTL_SECONDS:
+            return {}
+        return entry
+
+    def update(self, cam_ip: str, user_name: str, password: str, **fields: Any) -> None:
+        """
+        Store probe results for a camera, keeping its other unexpired fields.
+
+        Args:
+            cam_ip: IP address of the camera
+            user_name: User name the results were probed with
+            password: Password the results were probed with
+            **fields: Values to store, e.g. auth="DIGEST", tz_offset_seconds=-18000
+        """
+        with self._lock:
+            cache = self._load()
+            credentials_key = _derive_key(cache["salt"], user_name, password)
+            entries = cache["cameras"].get(cam_ip)
+            if not isinstance(entries, dict):
+                entries = cache["cameras"][cam_ip] = {}
+            entry = entries.get(credentials_key)
+            if not isinstance(entry, dict) or time.time() - entry.get("cached_at", 0) > self.TTL_SECONDS:
+                entry = {}
+            entry.update(fields, cached_at=time.time())
+            entries[credentials_key] = entry
+            self._save(cache)
+
+    def discard(self, cam_ip: str) -> None:
+        """
+        Remove the cached probe results for a camera, for all credentials.
+
+        Args:
+            cam_ip: IP address of the camera
+        """
+        with self._lock:
+            cache = self._load()
+            if cache["cameras"].pop(cam_ip, None) is not None:
+                self._save(cache)
+
+    def _load(self) -> Dict[str, Any]:
+        """Read the cache; a missing or unreadable file gives an empty one with a new salt."""
+        try:
+            cache = json.loads(self.cache_file.read_bytes())
+            if isinstance(cache, dict) and isinstance(cache.get("cameras"), dict):
+                bytes.fromhex(cache["salt"])
+                return cache
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return {"salt": os.urandom(16).hex(), "cameras": {}}
+
+    def _save(self, cache: Dict[str, Any]) -> None:
+        # A cache that cannot be written only costs the probes next time
+        try:
+            self.cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # mkstemp creates the file 0600: the keys derive from passwords
+            fd, temp_name = tempfile.mkstemp(
+                prefix=self.cache_file.name + ".", suffix=".tmp", dir=self.cache_file.parent,
+            )
+            try:
+                with open(fd, "w", encoding="utf-8") as f:
+                    json.dump(cache, f, indent=2)
+                os.replace(temp_name, self.cache_file)
+            except BaseException:
+                os.unlink(temp_name)
+                raise
+        except OSError:
+            pass
@@ -1,7 +1,9 @@
 import os
 import subprocess
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 from .logging import LogPrinter, logging_wrapper
 
@@ -15,10 +17,39 @@ DELAY_BETWEEN_DOWNLOADING_FILES_SECONDS = 1
 DELAY_AFTER_TIMEOUT_SECONDS = 5
 
 MAX_VIDEOS_NUMBER_IN_ONE_REQUEST = 50  # Reduced from 100 for better stability
+MAX_PARALLEL_FILE_DOWNLOADS = 4
+MAX_PARALLEL_TRACK_SEARCHES = 4
+# Searches and downloads in flight against one NVR, across all its cameras;
+# NVRs limit parallel streams
+MAX_PARALLEL_NVR_STREAMS = 4
+MIN_PARALLEL_SEARCH_INTERVAL = timedelta(hours=1)  # shorter intervals are searched in one go
 
 video_file_extension = ".mp4"
 
 
+_nvr_streams = {}
+_nvr_reboot_locks = {}
+_nvr_last_reboot = {}
+_nvr_registry_lock = threading.Lock()
+
+
+def nvr_stream_slot(cam_ip):
+    """Return the semaphore bounding the concurrent streams to one NVR."""
+    with _nvr_registry_lock:
+        slot = _nvr_streams.get(cam_ip)
+        if slot is None:
+            slot = _nvr_streams[cam_ip] = threading.BoundedSemaphore(MAX_PARALLEL_NVR_STREAMS)
+        return slot
+
+
+def _nvr_reboot_lock(cam_ip):
+    with _nvr_registry_lock:
+        lock = _nvr_reboot_locks.get(cam_ip)
+        if lock is None:
+            lock = _nvr_reboot_locks[cam_ip] = threading.Lock()
+        return lock
+
+
 def get_path_to_video_archive(cam_ip: str, camera_channel: int = 1):
     return os.path.join(path_to_video_archive, cam_ip, f"camera{camera_channel}")
 
@@ -28,9 +59,8 @@ def download_videos(tracks, auth_handler, cam_ip, camera_channel=1):
 
 
 def create_directory_for(file_path):
-    directory = os.path.dirname(file_path)
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    # exist_ok: concurrent download workers create the same directory
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
 
 def set_video_exif_metadata(file_path: str, start_datetime: datetime) -> bool:
@@ -99,14 +129,36 @@ def set_video_exif_metadata(file_path: str, start_datetime: datetime) -> bool:
 
 @logging_wrapper(before=LogPrinter.download_tracks)
 def download_tracks(tracks, auth_handler, cam_ip, camera_channel=1):
-    for track in tracks:
-        # TODO retry only N times
-        while True:
-            if download_file_with_retry(auth_handler, cam_ip, track, camera_channel):
-                break
-            time.sleep(DELAY_AFTER_TIMEOUT_SECONDS)
-
-        time.sleep(DELAY_BETWEEN_DOWNLOADING_FILES_SECONDS)
+    # Paginated searches can return the boundary track twice; two workers
+    # must never write the same file
+    tracks = list({track.url_to_download(): track for track in tracks}.values())
+    if not tracks:
+        return
+
+    # Downloads are I/O bound; overlap them up to the NVR's stream limit
+    max_workers = min(len(tracks), MAX_PARALLEL_FILE_DOWNLOADS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(download_track, track, auth_handler, cam_ip, camera_channel)
+            for track in tracks
+        ]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def download_track(track, auth_handler, cam_ip, camera_channel=1):
+    # TODO retry only N times
+    while True:
+        if download_file_with_retry(auth_handler, cam_ip, track, camera_channel):
+            break
+        time.sleep(DELAY_AFTER_TIMEOUT_SECONDS)
+
+    time.sleep(DELAY_BETWEEN_DOWNLOADING_FILES_SECONDS)
 
 
 def download_file_with_retry(auth_handler, cam_ip, track, camera_channel=1):
@@ -120,15 +172,31 @@ def download_file_with_retry(auth_handler, cam_ip, track, camera_channel=1):
     url_to_download = track.url_to_download()
 
     create_directory_for(file_name)
-    answer = download_file(auth_handler, cam_ip, url_to_download, file_name)
+    with nvr_stream_slot(cam_ip):
+        answer = download_file(auth_handler, cam_ip, url_to_download, file_name)
     if answer:
         # Set Exif metadata using the start time of the video
         set_video_exif_metadata(file_name, time_interval.start_time)
         return True
-    if answer.status_code == CameraSdk.DEVICE_ERROR_CODE:
+    # None means the request itself failed (timeout, connection error)
+    if answer is not None and answer.status_code == CameraSdk.DEVICE_ERROR_CODE:
+        reboot_camera_once(auth_handler, cam_ip, failed_at=time.monotonic())
+    return False
+
+
+def reboot_camera_once(auth_handler, cam_ip, failed_at):
+    """
+    Reboot the NVR and wait for it, unless a reboot finished after failed_at.
+
+    Workers that see the device error together reboot it only once; the
+    others wait for that reboot and then retry.
+    """
+    with _nvr_reboot_lock(cam_ip):
+        if _nvr_last_reboot.get(cam_ip, float("-inf")) > failed_at:
+            return
         reboot_camera(auth_handler, cam_ip)
         wait_until_camera_rebooted(cam_ip)
-    return False
+        _nvr_last_reboot[cam_ip] = time.monotonic()
 
 
 @logging_wrapper(
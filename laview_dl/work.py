@@ -1,5 +1,6 @@
 import os
 from datetime import timedelta
+from xml.etree.ElementTree import ParseError
 
 import requests
 
@@ -10,7 +11,22 @@ from .time_interval import TimeInterval
 from .utils import download_videos
 
 
-def work(camera_ip, start_datetime_str, end_datetime_str, use_utc_time, camera_channel=1):
+def work(
+    camera_ip,
+    start_datetime_str,
+    end_datetime_str,
+    use_utc_time,
+    camera_channel=1,
+    auth_handler=None,
+    local_time_offset=None,
+):
+    """
+    Download the videos of one camera channel for the given time range.
+
+    auth_handler and local_time_offset may be passed in by callers that
+    process several channels of the same NVR, to skip re-detecting them
+    over the network for every channel.
+    """
     logger = Logger.get_logger()
     try:
         logger.info(f"Processing IP {camera_ip}.")
@@ -26,23 +42,25 @@ def work(camera_ip, start_datetime_str, end_datetime_str, use_utc_time, camera_c
         logger.talk(f"📊 Time range: {start_datetime_str} to {end_datetime_str}")
         logger.whisper(f"⚙️ Using {'UTC' if use_utc_time else 'local'} time mode")
 
-        user_name = os.getenv("LAVIEW_NVR_USER")
-        user_password = os.getenv("LAVIEW_NVR_PASS")
+        if auth_handler is None:
+            user_name = os.getenv("LAVIEW_NVR_USER")
+            user_password = os.getenv("LAVIEW_NVR_PASS")
 
-        logger.murmur(f"🔐 Checking authentication for user: {user_name or 'not set'}")
+            logger.murmur(f"🔐 Checking authentication for user: {user_name or 'not set'}")
 
-        auth_type = CameraSdk.get_auth_type(camera_ip, user_name, user_password)
-        if auth_type == AuthType.UNAUTHORISED:
-            raise RuntimeError("Unauthorised! Check login and password")
+            auth_type = CameraSdk.get_auth_type(camera_ip, user_name, user_password)
+            if auth_type == AuthType.UNAUTHORISED:
+                raise RuntimeError("Unauthorised! Check login and password")
 
-        logger.hint(f"✅ Authentication type: {auth_type}")
-        auth_handler = CameraSdk.get_auth(auth_type, user_name, user_password)
+            logger.hint(f"✅ Authentication type: {auth_type}")
+            auth_handler = CameraSdk.get_auth(auth_type, user_name, user_password)
 
-        if use_utc_time:
-            local_time_offset = timedelta()
-        else:
-            logger.clue("🕐 Getting time offset from camera...")
-            local_time_offset = CameraSdk.get_time_offset(auth_handler, camera_ip)
+        if local_time_offset is None:
+            if use_utc_time:
+                local_time_offset = timedelta()
+            else:
+                logger.clue("🕐 Getting time offset from camera...")
+                local_time_offset = CameraSdk.get_time_offset(auth_handler, camera_ip)
 
         logger.trace(f"⏰ Local time offset: {local_time_offset}")
 
@@ -58,5 +76,13 @@ def work(camera_ip, start_datetime_str, end_datetime_str, use_utc_time, camera_c
     except requests.exceptions.ConnectionError as e:
         logger.error(f"Connection error: {e}")
 
-    except Exception as e:
-        logger.exception(e)
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Request error: {e}")
+
+    except ParseError as e:
+        logger.error(f"Invalid XML answer from {camera_ip}: {e}")
+
+    except (RuntimeError, ValueError) as e:
+        # Expected failures (auth, NVR errors, bad datetimes); the traceback
+        # adds nothing, anything else propagates to the caller.
+        logger.error(f"Error: {e}")
@@ -1,7 +1,25 @@
+import gzip
+import io
+import threading
+import time
 import unittest
-from datetime import timedelta
+from datetime import datetime, timedelta
+from unittest import mock
 
-from src.camera_sdk import CameraSdk
+import requests
+from urllib3.response import HTTPResponse
+
+from laview_dl import camerasdk
+from laview_dl.camerasdk import CameraSdk, get_all_tracks, split_time_interval
+from laview_dl.time_interval import TimeInterval
+from laview_dl.track import Track
+
+
+def make_track(name, start, end):
+    return Track(
+        f"rtsp://10.0.0.1/Streaming/tracks/101?starttime={start}&endtime={end}&name={name}&size=100",
+        timedelta(),
+    )
 
 
 class TestParseTimeInfo(unittest.TestCase):
@@ -33,6 +51,236 @@ class TestParseTimeInfo(unittest.TestCase):
         actual_time_offset = CameraSdk.parse_timezone(raw_timezone)
         self.assertEqual(expected_time_offset, actual_time_offset)
 
+    def test_decode_timezone_half_hour(self):
+        raw_timezone = "IST-5:30:00"
+        expected_time_offset = timedelta(hours=5, minutes=30)
+
+        actual_time_offset = CameraSdk.parse_timezone(raw_timezone)
+        self.assertEqual(expected_time_offset, actual_time_offset)
+
+    def test_decode_timezone_with_dst_rule(self):
+        raw_timezone = "CST+6:00:00DST01:00:00,M3.2.0/02:00:00,M11.1.0/02:00:00"
+        expected_time_offset = timedelta(hours=-7)
+
+        actual_time_offset = CameraSdk.parse_timezone(raw_timezone)
+        self.assertEqual(expected_time_offset, actual_time_offset)
+
+    def test_decode_timezone_with_dst_half_hour(self):
+        raw_timezone = "NST+3:30:00DST00:30:00"
+        expected_time_offset = timedelta(hours=-4)
+
+        actual_time_offset = CameraSdk.parse_timezone(raw_timezone)
+        self.assertEqual(expected_time_offset, actual_time_offset)
+
+    def test_decode_timezone_without_dst_offset(self):
+        raw_timezone = "CST+5:00:00DST"
+        expected_time_offset = timedelta(hours=-5)
+
+        actual_time_offset = CameraSdk.parse_timezone(raw_timezone)
+        self.assertEqual(expected_time_offset, actual_time_offset)
+
+    def test_decode_timezone_bare_zone_name(self):
+        for raw_timezone in ("UTC", "GMT", "EST", "", None):
+            with self.subTest(raw_timezone=raw_timezone):
+                self.assertEqual(timedelta(0), CameraSdk.parse_timezone(raw_timezone))
+
+    def test_decode_timezone_malformed_offset(self):
+        self.assertEqual(timedelta(0), CameraSdk.parse_timezone("CST+5"))
+
+
+def make_answer(body):
+    """Build a streamed, gzip-encoded response like the NVR's search answer."""
+    answer = requests.Response()
+    answer.status_code = 200
+    answer.raw = HTTPResponse(
+        body=io.BytesIO(gzip.compress(body.encode("utf-8"))),
+        headers={"Content-Encoding": "gzip"},
+        preload_content=False,
+        decode_content=False,
+    )
+    return answer
+
+
+class TestCreateTracksFromInfo(unittest.TestCase):
+    search_result = """<?xml version="1.0" encoding="UTF-8"?>
+<CMSearchResult version="2.0" xmlns="http://www.hikvision.com/ver20/XMLSchema">
+  <searchID>C8A4D1F0-0000-0000-0000-000000000000</searchID>
+  <responseStatus>true</responseStatus>
+  <responseStatusStrg>{status}</responseStatusStrg>
+  <numOfMatches>{count}</numOfMatches>
+  {match_list}
+</CMSearchResult>
+"""
+    match_item = """<searchMatchItem>
+      <trackID>101</trackID>
+      <timeSpan>
+        <startTime>{start}</startTime>
+        <endTime>{end}</endTime>
+      </timeSpan>
+      <mediaSegmentDescriptor>
+        <contentType>video</contentType>
+        <playbackURI>rtsp://10.0.0.1/Streaming/tracks/101/?starttime={start_uri}&amp;endtime={end_uri}&amp;name={name}&amp;size=1000</playbackURI>
+      </mediaSegmentDescriptor>
+    </searchMatchItem>"""
+
+    def test_namespaced_gzip_result(self):
+        items = "".join([
+            self.match_item.format(
+                start="2020-04-15T00:30:00Z", end="2020-04-15T00:45:00Z",
+                start_uri="20200415T003000Z", end_uri="20200415T004500Z", name="00010000001",
+            ),
+            self.match_item.format(
+                start="2020-04-15T00:45:00Z", end="2020-04-15T01:00:00Z",
+                start_uri="20200415T004500Z", end_uri="20200415T010000Z", name="00010000002",
+            ),
+        ])
+        answer = make_answer(self.search_result.format(
+            status="MORE", count=2, match_list=f"<matchList>{items}</matchList>",
+        ))
+
+        tracks = CameraSdk.create_tracks_from_info(answer, timedelta(hours=5))
+
+        self.assertEqual(["00010000001", "00010000002"], [track.name() for track in tracks])
+        self.assertEqual(
+            TimeInterval(datetime(2020, 4, 15, 0, 30), datetime(2020, 4, 15, 0, 45)),
+            tracks[0].get_time_interval(),
+        )
+        self.assertEqual(timedelta(hours=5), tracks[0].get_time_interval().local_time_offset)
+        self.assertEqual(
+            "rtsp://10.0.0.1/Streaming/tracks/101/?name=00010000001", tracks[0].url_to_download(),
+        )
+
+    def test_empty_result(self):
+        answer = make_answer(self.search_result.format(status="NO MATCHES", count=0, match_list=""))
+
+        self.assertEqual([], CameraSdk.create_tracks_from_info(answer, timedelta()))
+
+
+class TestSplitTimeInterval(unittest.TestCase):
+    def test_short_interval_is_not_split(self):
+        interval = TimeInterval(datetime(2020, 4, 15, 0, 0), datetime(2020, 4, 15, 1, 59))
+
+        self.assertEqual([interval], split_time_interval(interval))
+
+    def test_split_covers_interval_without_gaps(self):
+        start = datetime(2020, 4, 15, 0, 0)
+        interval = TimeInterval(start, start + timedelta(hours=10), timedelta(hours=5))
+
+        parts = split_time_interval(interval)
+
+        self.assertEqual(camerasdk.MAX_PARALLEL_TRACK_SEARCHES, len(parts))
+        self.assertEqual(interval.start_time, parts[0].start_time)
+        self.assertEqual(interval.end_time, parts[-1].end_time)
+        for previous, current in zip(parts, parts[1:]):
+            self.assertEqual(previous.end_time, current.start_time)
+        for part in parts:
+            self.assertEqual(timedelta(hours=5), part.local_time_offset)
+
+    def test_parts_are_at_least_the_minimum_length(self):
+        start = datetime(2020, 4, 15, 0, 0)
+        interval = TimeInterval(start, start + timedelta(hours=2, minutes=30))
+
+        parts = split_time_interval(interval)
+
+        self.assertEqual(2, len(parts))
+        for part in parts:
+            self.assertGreaterEqual(part.end_time - part.start_time, camerasdk.MIN_PARALLEL_SEARCH_INTERVAL)
+
+
+class TestGetAllTracks(unittest.TestCase):
+    start = datetime(2020, 4, 15, 0, 0)
+
+    def search(self, results):
+        """Patch get_tracks_in_interval to answer each sub-interval from results by start time."""
+        def get_tracks_in_interval(_auth_handler, _cam_ip, interval, _camera_channel):
+            return results[interval.start_time]
+
+        return mock.patch.object(camerasdk, "get_tracks_in_interval", side_effect=get_tracks_in_interval)
+
+    def test_boundary_duplicates_are_removed_in_order(self):
+        interval = TimeInterval(self.start, self.start + timedelta(hours=4))
+        starts = [split.start_time for split in split_time_interval(interval)]
+        first = make_track("1", "20200415T000000Z", "20200415T005000Z")
+        spanning = make_track("2", "20200415T005000Z", "20200415T011000Z")
+        spanning_again = make_track("2", "20200415T005000Z", "20200415T011000Z")
+        last = make_track("3", "20200415T031000Z", "20200415T035000Z")
+        results = {start: [] for start in starts}
+        results[starts[0]] = [first, spanning]
+        results[starts[1]] = [spanning_again]
+        results[starts[-1]] = [last]
+
+        with self.search(results) as get_tracks_in_interval:
+            tracks = get_all_tracks(None, "10.0.0.1", interval)
+
+        self.assertEqual(len(starts), get_tracks_in_interval.call_count)
+        self.assertEqual(["1", "2", "3"], [track.name() for track in tracks])
+
+    def test_failed_sub_search_returns_no_tracks(self):
+        interval = TimeInterval(self.start, self.start + timedelta(hours=4))
+        results = {split.start_time: [] for split in split_time_interval(interval)}
+        results[self.start] = [make_track("1", "20200415T000000Z", "20200415T005000Z")]
+        results[self.start + timedelta(hours=1)] = None
+
+        with self.search(results):
+            self.assertEqual([], get_all_tracks(None, "10.0.0.1", interval))
+
+    def test_short_interval_is_searched_once(self):
+        interval = TimeInterval(self.start, self.start + timedelta(minutes=30))
+        results = {self.start: [make_track("1", "20200415T000000Z", "20200415T002000Z")]}
+
+        with self.search(results) as get_tracks_in_interval:
+            tracks = get_all_tracks(None, "10.0.0.1", interval)
+
+        get_tracks_in_interval.assert_called_once()
+        self.assertEqual(["1"], [track.name() for track in tracks])
+
+    def test_failed_single_search_returns_no_tracks(self):
+        interval = TimeInterval(self.start, self.start + timedelta(minutes=30))
+
+        with self.search({self.start: None}):
+            self.assertEqual([], get_all_tracks(None, "10.0.0.1", interval))
+
+
+class TestDetectAvailableCameras(unittest.TestCase):
+    def test_probes_stay_within_nvr_stream_limit(self):
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def post(*args, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return mock.Mock(ok=True)
+
+        with mock.patch.object(CameraSdk, "_CameraSdk__make_post_request", side_effect=post):
+            cameras = CameraSdk.detect_available_cameras(None, "10.0.0.9", max_channels=10)
+
+        self.assertEqual(list(range(10)), [camera["id"] for camera in cameras])
+        self.assertLessEqual(peak[0], camerasdk.MAX_PARALLEL_NVR_STREAMS)
+
+
+class TestWaitUntilCameraRebooted(unittest.TestCase):
+    def test_stalled_connect_is_reopened(self):
+        sockets = [mock.Mock(), mock.Mock()]
+        sockets[1].getsockopt.return_value = 0
+
+        # The first connect never completes; its replacement succeeds
+        def wait_writable(sock, timeout):
+            return sock is sockets[1]
+
+        with mock.patch.object(CameraSdk, "_CameraSdk__start_connect", side_effect=sockets) as start, \
+                mock.patch.object(CameraSdk, "_CameraSdk__REBOOT_CONNECT_MAX_SECONDS", 0), \
+                mock.patch.object(camerasdk, "_wait_writable", side_effect=wait_writable):
+            self.assertTrue(CameraSdk.wait_until_camera_rebooted("10.0.0.1", 5, 0))
+
+        self.assertEqual(2, start.call_count)
+        sockets[0].close.assert_called_once()
+        sockets[1].shutdown.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
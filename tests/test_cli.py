@@ -0,0 +1,90 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from laview_dl import cli
+
+
+def parse(*argv):
+    with mock.patch("sys.argv", ["laview-cli", *argv]):
+        return cli.parse_parameters()
+
+
+class TestParseParameters(unittest.TestCase):
+    def test_device_start_end(self):
+        args = parse("--device", "shop", "yesterday", "now")
+
+        self.assertEqual("shop", args.device)
+        self.assertIsNone(args.IP)
+        self.assertEqual("yesterday", args.START_DATETIME)
+        self.assertEqual("now", args.END_DATETIME)
+
+    def test_device_start_only(self):
+        args = parse("--device", "shop", "yesterday")
+
+        self.assertIsNone(args.IP)
+        self.assertEqual("yesterday", args.START_DATETIME)
+        self.assertIsNone(args.END_DATETIME)
+
+    def test_legacy_ip_start_end(self):
+        args = parse("--camera", "2", "10.0.0.1", "2020-04-15 00:30:00", "2020-04-15 10:59:59")
+
+        self.assertIsNone(args.device)
+        self.assertEqual(2, args.camera)
+        self.assertEqual("10.0.0.1", args.IP)
+        self.assertEqual("2020-04-15 00:30:00", args.START_DATETIME)
+        self.assertEqual("2020-04-15 10:59:59", args.END_DATETIME)
+
+    def test_flags_between_positionals(self):
+        args = parse("10.0.0.1", "yesterday", "-vv", "--camera", "3", "now")
+
+        self.assertEqual(("10.0.0.1", "yesterday", "now"), (args.IP, args.START_DATETIME, args.END_DATETIME))
+        self.assertEqual(2, args.verbose)
+        self.assertEqual(3, args.camera)
+
+    def test_device_flag_after_positionals(self):
+        args = parse("yesterday", "now", "--device", "shop")
+
+        self.assertEqual("shop", args.device)
+        self.assertEqual(("yesterday", "now"), (args.START_DATETIME, args.END_DATETIME))
+
+    def test_lone_action_flags(self):
+        for flag, dest in (("--setup", "setup"), ("--list-devices", "list_devices"),
+                           ("--remove-device", "remove_device")):
+            with self.subTest(flag=flag):
+                args = parse(flag)
+
+                self.assertTrue(getattr(args, dest))
+                self.assertFalse(args.status)
+                self.assertIsNone(args.device)
+                self.assertIsNone(args.START_DATETIME)
+
+    def test_status_with_device(self):
+        args = parse("--status", "--device", "shop")
+
+        self.assertTrue(args.status)
+        self.assertEqual("shop", args.device)
+        self.assertIsNone(args.START_DATETIME)
+
+    def test_no_arguments_prints_short_help(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.assertIsNone(parse())
+
+        self.assertIn("usage:", stdout.getvalue())
+
+
+class TestParseParametersHelp(unittest.TestCase):
+    def test_help_shows_examples_after_parser_reuse(self):
+        parse("10.0.0.1", "2020-04-15 00:30:00")
+
+        stdout = io.StringIO()
+        with self.assertRaises(SystemExit), contextlib.redirect_stdout(stdout):
+            parse("--help")
+
+        self.assertIn("Examples:", stdout.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from laview_dl.config import ConfigManager
+
+
+class TestConfigManagerCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+        self.config_manager = ConfigManager(self._tmp_dir.name)
+
+    def test_missing_config_is_empty(self):
+        self.assertIsNone(self.config_manager.get_device_config("shop"))
+        self.assertEqual((), self.config_manager.list_devices())
+
+    def test_round_trip(self):
+        expected_config = {"ip_address": "10.0.0.1", "camera_channel": 2}
+        self.config_manager.set_device_config("shop", expected_config)
+
+        self.assertEqual(expected_config, self.config_manager.get_device_config("shop"))
+        self.assertEqual(("shop",), self.config_manager.list_devices())
+
+    def test_repeated_loads_parse_once(self):
+        self.config_manager.set_device_config("shop", {"ip_address": "10.0.0.1"})
+        ConfigManager._cache.clear()
+        reader = mock.Mock(wraps=self.config_manager._read_toml)
+
+        with mock.patch.object(ConfigManager, "_read_toml", reader):
+            configs = [self.config_manager.get_device_config("shop") for _ in range(3)]
+
+        self.assertEqual(1, reader.call_count)
+        self.assertEqual([{"ip_address": "10.0.0.1"}] * 3, configs)
+
+    def test_save_invalidates_cache(self):
+        self.config_manager.set_device_config("shop", {"ip_address": "10.0.0.1"})
+        self.config_manager.get_device_config("shop")
+        self.config_manager.set_device_config("office", {"ip_address": "10.0.0.2"})
+
+        other_manager = ConfigManager(self._tmp_dir.name)
+        self.assertEqual(("shop", "office"), other_manager.list_devices())
+
+    def test_unchanged_config_is_not_rewritten(self):
+        self.config_manager.set_device_config("shop", {"ip_address": "10.0.0.1"})
+
+        with mock.patch.object(ConfigManager, "_atomic_write") as atomic_write:
+            self.config_manager.set_device_config("shop", {"ip_address": "10.0.0.1"})
+
+        atomic_write.assert_not_called()
+
+    def test_new_config_is_private(self):
+        self.config_manager.set_device_config("shop", {"ip_address": "10.0.0.1", "password": "secret"})
+
+        self.assertEqual(0o600, stat.S_IMODE(self.config_manager.config_file.stat().st_mode))
+
+    def test_save_keeps_file_mode(self):
+        self.config_manager.set_device_config("shop", {"ip_address": "10.0.0.1"})
+        self.config_manager.config_file.chmod(0o640)
+        self.config_manager.set_device_config("office", {"ip_address": "10.0.0.2"})
+
+        self.assertEqual(0o640, stat.S_IMODE(self.config_manager.config_file.stat().st_mode))
+        self.assertEqual([], list(Path(self._tmp_dir.name).glob("*.tmp")))
+
+    def test_returned_config_does_not_alias_cache(self):
+        self.config_manager.set_device_config("shop", {"ip_address": "10.0.0.1"})
+        config = self.config_manager._load_config()
+        config["office"] = {}
+
+        self.assertEqual(("shop",), self.config_manager.list_devices())
+
+    def test_json_fallback_keeps_newer_toml(self):
+        self.config_manager.json_config_file.write_text('{"shop": {"ip_address": "10.0.0.1"}}')
+        self.config_manager.config_file.write_text("not = [valid toml")
+
+        self.assertEqual(("shop",), self.config_manager.list_devices())
+        self.assertEqual("not = [valid toml", self.config_manager.config_file.read_text())
+        self.assertTrue(self.config_manager.json_config_file.exists())
+
+    def test_json_config_is_migrated(self):
+        self.config_manager.json_config_file.write_text('{"shop": {"ip_address": "10.0.0.1"}}')
+
+        self.assertEqual(("shop",), self.config_manager.list_devices())
+        self.assertFalse(self.config_manager.json_config_file.exists())
+        self.assertEqual(("shop",), ConfigManager(self._tmp_dir.name).list_devices())
+
+
+class TestConfigManagerBatch(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+        self.config_manager = ConfigManager(self._tmp_dir.name)
+
+    def test_batch_writes_once(self):
+        with mock.patch.object(
+            ConfigManager, "_save_config", autospec=True, side_effect=ConfigManager._save_config,
+        ) as save_config:
+            with self.config_manager:
+                self.config_manager.set_device_config("shop", {"ip_address": "10.0.0.1"})
+                self.config_manager.set_device_config("office", {"ip_address": "10.0.0.2"})
+                self.config_manager.remove_device("shop")
+                self.assertEqual(("office",), self.config_manager.list_devices())
+
+        self.assertEqual(1, save_config.call_count)
+        self.assertEqual(("office",), ConfigManager(self._tmp_dir.name).list_devices())
+
+    def test_batch_discarded_on_error(self):
+        with self.assertRaises(RuntimeError), self.config_manager:
+            self.config_manager.set_device_config("shop", {"ip_address": "10.0.0.1"})
+            raise RuntimeError
+
+        self.assertEqual((), ConfigManager(self._tmp_dir.name).list_devices())
+
+
+if __name__ == "__main__":
+    unittest.main()
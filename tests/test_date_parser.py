@@ -0,0 +1,33 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from laview_dl.date_parser import FlexibleDateParser
+
+
+class TestFlexibleDateParser(unittest.TestCase):
+    def test_exact_formats_skip_dateparser(self):
+        with mock.patch("dateparser.parse") as dateparser_parse:
+            self.assertEqual(
+                datetime(2020, 4, 15, 0, 30), FlexibleDateParser.parse_datetime("2020-04-15 00:30:00"),
+            )
+            self.assertEqual(
+                datetime(2020, 4, 15, 0, 30), FlexibleDateParser.parse_datetime("2020-04-15T00:30:00"),
+            )
+            self.assertEqual(datetime(2020, 4, 15), FlexibleDateParser.parse_datetime(" 2020-04-15 "))
+            FlexibleDateParser.parse_datetime("now")
+
+        dateparser_parse.assert_not_called()
+
+    def test_natural_language_falls_back_to_dateparser(self):
+        self.assertEqual(
+            datetime(2025, 8, 30, 8, 0), FlexibleDateParser.parse_datetime("August 30, 2025 08:00 AM"),
+        )
+
+    def test_unparseable_text_raises(self):
+        with self.assertRaises(ValueError):
+            FlexibleDateParser.parse_datetime("not a date")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from laview_dl.probe_cache import ProbeCache
+
+
+class TestProbeCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp_dir.cleanup)
+        self.cache_file = os.path.join(self._tmp_dir.name, "probes.json")
+        self.probe_cache = ProbeCache(self.cache_file)
+
+    def test_missing_entry_is_empty(self):
+        self.assertEqual({}, self.probe_cache.get("10.0.0.1", "admin", "secret"))
+
+    def test_update_merges_fields_and_persists(self):
+        self.probe_cache.update("10.0.0.1", "admin", "secret", auth="DIGEST")
+        self.probe_cache.update("10.0.0.1", "admin", "secret", tz_offset_seconds=-18000)
+
+        entry = ProbeCache(self.cache_file).get("10.0.0.1", "admin", "secret")
+        self.assertEqual("DIGEST", entry["auth"])
+        self.assertEqual(-18000, entry["tz_offset_seconds"])
+
+    def test_entries_are_per_credentials(self):
+        self.probe_cache.update("10.0.0.1", "admin", "secret", auth="DIGEST")
+
+        self.assertEqual({}, self.probe_cache.get("10.0.0.1", "admin", "wrong"))
+        self.assertEqual({}, self.probe_cache.get("10.0.0.1", "guest", "secret"))
+        self.assertNotIn("secret", open(self.cache_file).read())
+
+    def test_cache_file_is_private_and_salted(self):
+        self.probe_cache.update("10.0.0.1", "admin", "secret", auth="DIGEST")
+        self.probe_cache.update("10.0.0.1", "admin", "secret", tz_offset_seconds=0)
+
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(self.cache_file).st_mode))
+        with open(self.cache_file) as f:
+            cache = json.load(f)
+        other_file = os.path.join(self._tmp_dir.name, "other.json")
+        ProbeCache(other_file).update("10.0.0.1", "admin", "secret", auth="DIGEST")
+        with open(other_file) as f:
+            other_cache = json.load(f)
+        # A fresh salt per file, so equal credentials give unrelated keys
+        self.assertNotEqual(cache["salt"], other_cache["salt"])
+        self.assertNotEqual(list(cache["cameras"]["10.0.0.1"]), list(other_cache["cameras"]["10.0.0.1"]))
+
+    def test_expired_entry_is_ignored(self):
+        self.probe_cache.update("10.0.0.1", "admin", "secret", auth="BASIC")
+
+        with mock.patch("laview_dl.probe_cache.time.time", return_value=1e12):
+            self.assertEqual({}, self.probe_cache.get("10.0.0.1", "admin", "secret"))
+
+    def test_discard(self):
+        self.probe_cache.update("10.0.0.1", "admin", "secret", auth="BASIC")
+        self.probe_cache.update("10.0.0.2", "admin", "secret", auth="DIGEST")
+        self.probe_cache.discard("10.0.0.1")
+
+        self.assertEqual({}, self.probe_cache.get("10.0.0.1", "admin", "secret"))
+        self.assertEqual("DIGEST", self.probe_cache.get("10.0.0.2", "admin", "secret")["auth"])
+
+    def test_discard_removes_all_credentials(self):
+        self.probe_cache.update("10.0.0.1", "admin", "secret", auth="BASIC")
+        self.probe_cache.update("10.0.0.1", "guest", "other", auth="DIGEST")
+        self.probe_cache.discard("10.0.0.1")
+
+        self.assertEqual({}, self.probe_cache.get("10.0.0.1", "admin", "secret"))
+        self.assertEqual({}, self.probe_cache.get("10.0.0.1", "guest", "other"))
+
+    def test_corrupt_file_is_treated_as_empty(self):
+        with open(self.cache_file, "w") as f:
+            f.write("{not json")
+
+        self.assertEqual({}, self.probe_cache.get("10.0.0.1", "admin", "secret"))
+
+
+if __name__ == "__main__":
+    unittest.main()
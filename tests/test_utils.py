@@ -1,5 +1,13 @@
+import os
+import tempfile
+import threading
+import time
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
+from unittest import mock
+
+from laview_dl import utils
+from laview_dl.track import Track
 
 
 class TestUtils:
@@ -35,5 +43,56 @@ class TestTestUtils(unittest.TestCase):
         self.assertEqual(expected_time_tz_text, actual_time_tz_text)
 
 
+class TestNvrLimits(unittest.TestCase):
+    def test_stream_slot_is_shared_per_nvr(self):
+        self.assertIs(utils.nvr_stream_slot("10.0.0.1"), utils.nvr_stream_slot("10.0.0.1"))
+        self.assertIsNot(utils.nvr_stream_slot("10.0.0.1"), utils.nvr_stream_slot("10.0.0.2"))
+
+    def test_concurrent_device_errors_reboot_once(self):
+        failed_at = time.monotonic()
+        with mock.patch.object(utils, "reboot_camera") as reboot_camera, \
+                mock.patch.object(utils, "wait_until_camera_rebooted"):
+            workers = [
+                threading.Thread(target=utils.reboot_camera_once, args=(None, "10.0.0.3", failed_at))
+                for _ in range(4)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        reboot_camera.assert_called_once_with(None, "10.0.0.3")
+
+
+class TestDownloadTracks(unittest.TestCase):
+    def test_parallel_downloads_create_missing_directory(self):
+        tracks = [
+            Track(
+                f"rtsp://10.0.0.1/Streaming/tracks/201?starttime=20200415T00{minute}00Z"
+                f"&endtime=20200415T00{minute}59Z&name=0001000000{minute}&size=100",
+                timedelta(),
+            )
+            for minute in ("10", "20", "30", "40")
+        ]
+        real_makedirs = os.makedirs
+
+        def slow_makedirs(*args, **kwargs):
+            # Let every worker get past any existence check first
+            time.sleep(0.05)
+            return real_makedirs(*args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as archive, \
+                mock.patch.object(utils, "path_to_video_archive", archive), \
+                mock.patch.object(utils, "DELAY_BETWEEN_DOWNLOADING_FILES_SECONDS", 0), \
+                mock.patch.object(utils, "download_file", return_value=True) as download_file, \
+                mock.patch.object(utils, "set_video_exif_metadata"), \
+                mock.patch.object(utils.os, "makedirs", side_effect=slow_makedirs):
+            utils.download_tracks(tracks, None, "10.0.0.1", 2)
+
+            self.assertTrue(os.path.isdir(os.path.join(archive, "10.0.0.1", "camera2")))
+
+        self.assertEqual(len(tracks), download_file.call_count)
+
+
 if __name__ == "__main__":
     unittest.main()